@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+
+"""
+Benchmarks for the Connect Four Board and Game hot paths.
+Author: Chris Lyon
+Contact: chris@cplyon.ca
+Date: 2026-10-17
+
+Run with:
+
+    python -m bench.bench_c4 --output results.json
+    python -m bench.bench_c4 --compare results.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from c4.c4 import Board
+from c4.c4 import Colour
+from c4.c4 import Game
+
+# (rows, columns, goal)
+SIZES = [(6, 7, 4), (20, 20, 5), (50, 50, 8), (100, 100, 8)]
+
+# slowdown, as a fraction, beyond which a benchmark is flagged
+THRESHOLD = 0.1
+
+
+def _rate(operation, operations: int, min_time: float) -> float:
+    """
+    Call operation, which performs operations operations, until at least
+    min_time seconds have passed.
+    Return the number of operations per second.
+    """
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        operation()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return calls * operations / elapsed
+
+
+def _random_board(rows: int, columns: int, goal: int, rng: random.Random):
+    """
+    Return a board half filled with random pieces, and the (colour, row,
+    column) of every piece on it.
+    """
+    board = Board(rows, columns, goal)
+    pieces = []
+    for _ in range(rows * columns // 2):
+        column = rng.choice(board.legal_moves())
+        colour = rng.choice((Colour.PLAYER_1, Colour.PLAYER_2))
+        pieces.append((colour, board.drop_piece(colour, column), column))
+    return board, pieces
+
+
+def bench_drop_piece(rows: int, columns: int, goal: int, min_time: float):
+    """
+    Moves per second: fill a board with drop_piece, then empty it with undo.
+    """
+    board = Board(rows, columns, goal)
+
+    def fill():
+        for column in range(columns):
+            for _ in range(rows):
+                board.drop_piece(Colour.PLAYER_1, column)
+        for column in range(columns):
+            for _ in range(rows):
+                board.undo(column)
+
+    return _rate(fill, rows * columns, min_time)
+
+
+def bench_check_win(rows: int, columns: int, goal: int, min_time: float):
+    """
+    Win checks per second: check_win for every piece on a half full board.
+    """
+    board, pieces = _random_board(rows, columns, goal, random.Random(0))
+
+    def check():
+        for colour, row, column in pieces:
+            board.check_win(colour, row, column)
+
+    return _rate(check, len(pieces), min_time)
+
+
+def bench_determine_winner(rows: int, columns: int, goal: int, min_time: float):
+    """
+    Calls per second of Game.determine_winner for every piece on a half full
+    board.
+    """
+    game = Game(rows=rows, columns=columns, goal=goal)
+    game.board, pieces = _random_board(rows, columns, goal, random.Random(0))
+
+    def check():
+        for colour, row, column in pieces:
+            game.determine_winner(colour, row, column)
+
+    return _rate(check, len(pieces), min_time)
+
+
+def bench_random_games(rows: int, columns: int, goal: int, min_time: float):
+    """
+    Complete games per second, with both players making random moves.
+    """
+    rng = random.Random(0)
+
+    def play():
+        game = Game(rows=rows, columns=columns, goal=goal)
+        while not game.winner:
+            game.play(rng.choice(game.board.legal_moves()) + 1)
+
+    return _rate(play, 1, min_time)
+
+
+def bench_memory(rows: int, columns: int, goal: int, min_time: float):
+    """
+    Bytes allocated per empty board.
+    """
+    count = 100
+    # build one first, so shared caches are not counted
+    Board(rows, columns, goal)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    boards = [Board(rows, columns, goal) for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del boards
+    return (after - before) / count
+
+
+# name: (function, unit, True if higher is better)
+BENCHMARKS = {
+    "drop_piece": (bench_drop_piece, "moves/s", True),
+    "check_win": (bench_check_win, "checks/s", True),
+    "determine_winner": (bench_determine_winner, "checks/s", True),
+    "random_games": (bench_random_games, "games/s", True),
+    "memory": (bench_memory, "bytes/board", False),
+}
+
+
+def run(sizes: list = SIZES, min_time: float = 0.5, names: list = None) -> dict:
+    """
+    Run the benchmarks in names, or all of them, on every board size.
+    Return the results, keyed by "<name>[<rows>x<columns>/<goal>]".
+    """
+    results = {}
+    for name, (function, unit, higher_is_better) in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+        for rows, columns, goal in sizes:
+            value = function(rows, columns, goal, min_time)
+            results[f"{name}[{rows}x{columns}/{goal}]"] = {
+                "value": value,
+                "unit": unit,
+                "higher_is_better": higher_is_better,
+            }
+    return results
+
+
+def compare(baseline: dict, current: dict, threshold: float = THRESHOLD) -> list:
+    """
+    Return (name, baseline value, current value, change) for every benchmark
+    in both results that got worse by more than threshold, where change is
+    the fractional slowdown.
+    """
+    regressions = []
+    for name, result in current.items():
+        if name not in baseline:
+            continue
+        old = baseline[name]["value"]
+        new = result["value"]
+        if not old or not new:
+            continue
+        if result["higher_is_better"]:
+            change = old / new - 1
+        else:
+            change = new / old - 1
+        if change > threshold:
+            regressions.append((name, old, new, change))
+    return regressions
+
+
+def main(argv: list = None) -> int:
+    """
+    Entry point for the benchmarks.
+    Return 1 if a comparison found regressions, 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark Board and Game.")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--compare", help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.5,
+        help="seconds to run each benchmark for",
+    )
+    parser.add_argument(
+        "--only", nargs="*", choices=sorted(BENCHMARKS), help="benchmarks to run"
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="*",
+        help="board sizes as ROWSxCOLUMNS/GOAL, for example 6x7/4",
+    )
+    args = parser.parse_args(argv)
+
+    sizes = SIZES
+    if args.sizes:
+        sizes = []
+        for size in args.sizes:
+            dimensions, goal = size.split("/")
+            rows, columns = dimensions.split("x")
+            sizes.append((int(rows), int(columns), int(goal)))
+
+    results = run(sizes, args.min_time, args.only)
+    for name, result in results.items():
+        print(f"{name:40} {result['value']:14.1f} {result['unit']}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {"python": platform.python_version(), "results": results},
+                f,
+                indent=2,
+            )
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(baseline, results, args.threshold)
+        for name, old, new, change in regressions:
+            print(f"SLOWER {name}: {old:.1f} -> {new:.1f} ({change:+.0%})")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+
+"""
+Computer Connect Four player, using negamax search with alpha-beta pruning.
+Author: Chris Lyon
+Contact: chris@cplyon.ca
+Date: 2026-10-17
+"""
+
+import time
+from dataclasses import dataclass
+from dataclasses import field
+
+from c4.c4 import Colour
+from c4.c4 import Player
+
+# transposition table entry flags
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+
+class _Timeout(Exception):
+    """
+    Raised inside the search when the time budget for a move is used up.
+    """
+
+
+class TranspositionTable:
+    """
+    Fixed-size table of search results, keyed on the board's Zobrist key.
+    A new entry replaces whatever was stored in its slot, so the table never
+    grows past size entries.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._keys = [None] * size
+        self._entries = [None] * size
+
+    def get(self, key: int) -> tuple:
+        """
+        Return the (depth, flag, score, column) entry stored for key.
+        Return None if key is not in the table.
+        """
+        index = key % self.size
+        if self._keys[index] == key:
+            return self._entries[index]
+        return None
+
+    def put(self, key: int, entry: tuple):
+        """
+        Store the (depth, flag, score, column) entry for key.
+        """
+        index = key % self.size
+        self._keys[index] = key
+        self._entries[index] = entry
+
+    def clear(self):
+        """
+        Remove all entries.
+        """
+        self._keys = [None] * self.size
+        self._entries = [None] * self.size
+
+
+class Search:
+    """
+    Iterative deepening negamax search with alpha-beta pruning.
+
+    Scores are from the point of view of the player to move. A win scores the
+    number of empty cells left before the winning piece was dropped, so
+    quicker wins score higher. Positions at the search horizon and tie games
+    score 0.
+    """
+
+    # check the clock every this many nodes, minus one
+    CLOCK_INTERVAL = 1023
+
+    def __init__(self, table_size: int = 1 << 20):
+        self.table = TranspositionTable(table_size)
+        self.nodes = 0
+        self._board = None
+        self._order = ()
+        self._deadline = None
+
+    def _load(self, board):
+        """
+        Prepare to search board.
+        """
+        self._board = board
+        centre = (board.columns - 1) / 2
+        self._order = tuple(
+            sorted(range(board.columns), key=lambda c: abs(c - centre))
+        )
+
+    def search(
+        self,
+        board,
+        colour: Colour,
+        time_budget: float = None,
+        max_depth: int = None,
+    ) -> tuple:
+        """
+        Search for the best move for colour on board.
+        The board is left exactly as it was found.
+        Return a tuple of (column, score, depth) for the deepest completed
+        iteration, where column is the 0-based column to play.
+        Return (None, 0, 0) if there are no legal moves.
+        """
+        if not board.legal_moves():
+            return None, 0, 0
+
+        self._load(board)
+        self.nodes = 0
+        remaining = board.rows * board.columns - board.filled_cells
+        if max_depth is None or max_depth > remaining:
+            max_depth = remaining
+        other = Colour.PLAYER_2 if colour is Colour.PLAYER_1 else Colour.PLAYER_1
+
+        deadline = None
+        if time_budget is not None:
+            deadline = time.perf_counter() + time_budget
+
+        best = None, 0, 0
+        for depth in range(1, max_depth + 1):
+            try:
+                column, score = self._root(colour, other, depth)
+            except _Timeout:
+                break
+            best = column, score, depth
+            # the first iteration always finishes, so there is a move to return
+            self._deadline = deadline
+            if score != 0:
+                # a forced win or loss was found, searching deeper won't
+                # change the outcome
+                break
+        self._deadline = None
+        return best
+
+    def _root(self, colour: Colour, other: Colour, depth: int) -> tuple:
+        board = self._board
+        entry = self.table.get(board.key)
+        order = self._order
+        if entry is not None and entry[3] is not None:
+            order = (entry[3],) + tuple(c for c in order if c != entry[3])
+
+        alpha = -(board.rows * board.columns + 1)
+        beta = -alpha
+        best_column = None
+        for column in order:
+            if board.is_column_full(column):
+                continue
+            score = self._try(colour, other, column, depth, -beta, -alpha)
+            if best_column is None or score > alpha:
+                alpha = score
+                best_column = column
+        self.table.put(board.key, (depth, EXACT, alpha, best_column))
+        return best_column, alpha
+
+    def _try(
+        self,
+        colour: Colour,
+        other: Colour,
+        column: int,
+        depth: int,
+        alpha: int,
+        beta: int,
+    ) -> int:
+        """
+        Play colour in column, and return its score for colour.
+        alpha and beta are the window of the opponent's reply.
+        """
+        board = self._board
+        remaining = board.rows * board.columns - board.filled_cells
+        row = board.drop_piece(colour, column)
+        try:
+            if board.check_win(colour, row, column):
+                return remaining
+            return -self._negamax(other, colour, depth - 1, alpha, beta)
+        finally:
+            board.undo(column)
+
+    def _negamax(
+        self, colour: Colour, other: Colour, depth: int, alpha: int, beta: int
+    ) -> int:
+        self.nodes += 1
+        if (
+            not self.nodes & self.CLOCK_INTERVAL
+            and self._deadline is not None
+            and time.perf_counter() > self._deadline
+        ):
+            raise _Timeout()
+
+        board = self._board
+        if board.is_full():
+            return 0
+        if depth == 0:
+            return 0
+
+        key = board.key
+        entry = self.table.get(key)
+        order = self._order
+        if entry is not None:
+            entry_depth, flag, score, best_column = entry
+            if entry_depth >= depth:
+                if flag == EXACT:
+                    return score
+                if flag == LOWER_BOUND:
+                    alpha = max(alpha, score)
+                else:
+                    beta = min(beta, score)
+                if alpha >= beta:
+                    return score
+            # try the best move from the last search of this position first
+            order = (best_column,) + tuple(c for c in order if c != best_column)
+
+        original_alpha = alpha
+        best_score = None
+        best_column = None
+        for column in order:
+            if board.is_column_full(column):
+                continue
+            score = self._try(colour, other, column, depth, -beta, -alpha)
+            if best_score is None or score > best_score:
+                best_score = score
+                best_column = column
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        if best_score <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_score >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self.table.put(key, (depth, flag, best_score, best_column))
+        return best_score
+
+
+@dataclass
+class AIPlayer(Player):
+    """
+    A computer player. Call choose_move to get the column it wants to play.
+    time_budget is the number of seconds it may spend on each move, and
+    max_depth limits how many moves ahead it looks.
+    book is an optional c4.book.OpeningBook to play from before searching.
+    """
+
+    time_budget: float = 1.0
+    max_depth: int = None
+    table_size: int = 1 << 20
+    book: object = field(default=None, repr=False, compare=False)
+    _search: Search = field(default=None, init=False, repr=False, compare=False)
+
+    def choose_move(self, game) -> int:
+        """
+        Return the column to pass to game.play, as a 1-based index.
+        Return None if there are no legal moves.
+        """
+        if self.book is not None:
+            found = self.book.lookup(game.board)
+            if found is not None:
+                return found[0] + 1
+        if self._search is None:
+            # keep the search, and its transposition table, between moves
+            self._search = Search(self.table_size)
+        column, _, _ = self._search.search(
+            game.board, self.colour, self.time_budget, self.max_depth
+        )
+        if column is None:
+            return None
+        return column + 1
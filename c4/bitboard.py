@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+
+"""
+Bitboard implementation of the Connect Four game board.
+Author: Chris Lyon
+Contact: chris@cplyon.ca
+Date: 2026-10-17
+"""
+
+from functools import lru_cache
+
+from c4.c4 import Colour
+from c4.c4 import zobrist_table
+
+
+@lru_cache(maxsize=None)
+def _geometry(rows: int, columns: int) -> tuple:
+    """
+    Return the bit masks shared by every BitBoard of the given size:
+    one mask per row, one per column, and one per diagonal in each direction.
+    Diagonals are keyed by (column - height) and (column + height).
+    """
+    height = rows + 1
+    row_masks = [0] * rows
+    column_masks = [0] * columns
+    down_diagonals = {}
+    up_diagonals = {}
+    for col in range(columns):
+        for h in range(rows):
+            bit = 1 << (col * height + h)
+            row_masks[h] |= bit
+            column_masks[col] |= bit
+            down_diagonals[col - h] = down_diagonals.get(col - h, 0) | bit
+            up_diagonals[col + h] = up_diagonals.get(col + h, 0) | bit
+    return row_masks, column_masks, down_diagonals, up_diagonals
+
+
+def has_streak(bits: int, shift: int, goal: int) -> bool:
+    """
+    Return True if bits contains goal set bits, each shift apart.
+    Return False otherwise.
+    """
+    # each pass doubles the length of the runs we know about, so this takes
+    # O(log goal) shift-and-AND steps rather than O(goal)
+    length = 1
+    while length < goal:
+        step = min(length, goal - length)
+        bits &= bits >> (shift * step)
+        if not bits:
+            return False
+        length += step
+    return bits != 0
+
+
+class BitBoard:
+    """
+    The game board, with customizable size, packed into one integer per
+    player.
+
+    Cells are numbered column by column from the bottom up. Each column has
+    one extra guard bit on top that is never set, so that shifting a streak
+    past the top of a column can never carry it into the next one.
+    """
+
+    def __init__(self, rows: int, columns: int, goal: int):
+        self.rows = rows
+        self.columns = columns
+        self.goal = goal
+        self.filled_cells = 0
+        self._height = rows + 1
+        # indexed by Colour, so _bits[Colour.NONE] is always 0
+        self._bits = [0, 0, 0]
+        self._heights = [0] * columns
+        self._legal_moves = tuple(range(columns))
+        # same Zobrist keys as Board, so the two can share position tables
+        self._zobrist = zobrist_table(rows, columns)
+        self.key = 0
+        self.mirror_key = 0
+        (
+            self._row_masks,
+            self._column_masks,
+            self._down_diagonals,
+            self._up_diagonals,
+        ) = _geometry(rows, columns)
+
+    def _colour_at(self, row: int, column: int) -> Colour:
+        bit = 1 << (column * self._height + self.rows - 1 - row)
+        if self._bits[Colour.PLAYER_1] & bit:
+            return Colour.PLAYER_1
+        if self._bits[Colour.PLAYER_2] & bit:
+            return Colour.PLAYER_2
+        return Colour.NONE
+
+    def __getitem__(self, key: int) -> tuple:
+        """
+        Allow indexing into the board, like a 2D array.
+        Rows are read-only; use drop_piece to change the board.
+        """
+        if key < 0:
+            key += self.rows
+        if not 0 <= key < self.rows:
+            raise IndexError("row index out of range")
+        return tuple(self._colour_at(key, col) for col in range(self.columns))
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the board.
+        """
+        printable_board = ""
+        for row in range(self.rows):
+            for colour in self[row]:
+                printable_board += f"{colour} "
+            printable_board += "\n"
+        return printable_board
+
+    def canonical_key(self) -> int:
+        """
+        Return a position key that is the same for this board and its
+        left-right mirror image.
+        """
+        return min(self.key, self.mirror_key)
+
+    def is_full(self) -> bool:
+        """
+        Return True if all cells on board have been filled.
+        Return False otherwise.
+        """
+        return self.filled_cells == (self.rows * self.columns)
+
+    def is_column_full(self, column: int) -> bool:
+        """
+        Return True if top-most cell in column is not NONE
+        Return False otherwise
+        """
+        return self._heights[column] == self.rows
+
+    def legal_moves(self) -> tuple:
+        """
+        Return the indices of all columns that are not full.
+        """
+        return self._legal_moves
+
+    def drop_piece(self, colour: Colour, column: int) -> int:
+        """
+        Set the lowest empty cell in column to colour.
+        Return the row that was coloured.
+        Return None if column is full.
+        """
+        h = self._heights[column]
+        if h == self.rows:
+            return None
+        self._bits[colour] |= 1 << (column * self._height + h)
+        self._heights[column] = h + 1
+        self.filled_cells += 1
+        values = self._zobrist[colour]
+        index = (self.rows - 1 - h) * self.columns
+        self.key ^= values[index + column]
+        self.mirror_key ^= values[index + self.columns - 1 - column]
+        if h + 1 == self.rows:
+            self._legal_moves = tuple(c for c in self._legal_moves if c != column)
+        return self.rows - 1 - h
+
+    def undo(self, column: int) -> int:
+        """
+        Remove the top-most piece from column.
+        Return the row that was cleared.
+        Return None if column is empty.
+        """
+        h = self._heights[column] - 1
+        if h < 0:
+            return None
+        bit = 1 << (column * self._height + h)
+        if self._bits[Colour.PLAYER_1] & bit:
+            colour = Colour.PLAYER_1
+        else:
+            colour = Colour.PLAYER_2
+        self._bits[colour] ^= bit
+        values = self._zobrist[colour]
+        index = (self.rows - 1 - h) * self.columns
+        self.key ^= values[index + column]
+        self.mirror_key ^= values[index + self.columns - 1 - column]
+        self._heights[column] = h
+        self.filled_cells -= 1
+        if h + 1 == self.rows:
+            self._legal_moves = tuple(sorted(self._legal_moves + (column,)))
+        return self.rows - 1 - h
+
+    def check_win(self, colour: Colour, row: int, column: int) -> bool:
+        """
+        Return True if the piece at row and column completes a streak of goal
+        or more cells horizontally, vertically or diagonally.
+        Return False otherwise.
+        """
+        return (
+            self.check_horizontal(colour, row, column)
+            or self.check_vertical(colour, row, column)
+            or self.check_top_left_to_bottom_right(colour, row, column)
+            or self.check_top_right_to_bottom_left(colour, row, column)
+        )
+
+    def _streak_through(self, bits: int, row: int, column: int, shift: int) -> bool:
+        """
+        Return True if bits, already masked to one line of the board, holds a
+        streak of goal or more cells through row and column.
+        Return False otherwise.
+        """
+        # any streak that fits within goal - 1 cells either side of this one
+        # must pass through it
+        index = column * self._height + self.rows - 1 - row
+        reach = (self.goal - 1) * shift
+        low = max(index - reach, 0)
+        window = ((1 << (index + reach + 1 - low)) - 1) << low
+        return has_streak(bits & window, shift, self.goal)
+
+    def check_top_left_to_bottom_right(
+        self, colour: Colour, row: int, column: int
+    ) -> bool:
+        """
+        Return True if there exists a diagonal streak of goal or more cells
+        through row and column.
+        Return False otherwise.
+        """
+        # heights grow upwards, so a top-left to bottom-right diagonal has a
+        # constant column + height
+        h = self.rows - 1 - row
+        bits = self._bits[colour] & self._up_diagonals[column + h]
+        return self._streak_through(bits, row, column, self._height - 1)
+
+    def check_top_right_to_bottom_left(
+        self, colour: Colour, row: int, column: int
+    ) -> bool:
+        """
+        Return True if there exists a diagonal streak of goal or more cells
+        through row and column.
+        Return False otherwise.
+        """
+        h = self.rows - 1 - row
+        bits = self._bits[colour] & self._down_diagonals[column - h]
+        return self._streak_through(bits, row, column, self._height + 1)
+
+    def check_horizontal(self, colour: Colour, row: int, column: int = None) -> bool:
+        """
+        Return True if there exists a horizontal streak of goal or more cells
+        through row and column.
+        If column is None, look for a streak anywhere in row.
+        Return False otherwise.
+        """
+        bits = self._bits[colour] & self._row_masks[self.rows - 1 - row]
+        if column is None:
+            return has_streak(bits, self._height, self.goal)
+        return self._streak_through(bits, row, column, self._height)
+
+    def check_vertical(self, colour: Colour, row: int, column: int) -> bool:
+        """
+        Return True if there exists a vertical streak of goal or more cells
+        on the board in column starting at row.
+        Return False otherwise.
+        """
+        h = self.rows - 1 - row
+        if h + 1 < self.goal:
+            return False
+        # the piece is on top because of gravity, so the streak can only run
+        # from it downwards
+        lowest = column * self._height + h + 1 - self.goal
+        streak = ((1 << self.goal) - 1) << lowest
+        return self._bits[colour] & streak == streak
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+
+"""
+Opening book of precomputed Connect Four moves.
+Author: Chris Lyon
+Contact: chris@cplyon.ca
+Date: 2026-10-17
+
+File layout, all integers little-endian:
+
+    header   magic "C4OB", version (u8), rows (u16), columns (u16),
+             goal (u16), number of entries (u64)
+    entries  canonical position key (u64), score (i16), column (u8),
+             sorted by key
+"""
+
+import argparse
+import mmap
+import struct
+import sys
+
+from c4.ai import Search
+from c4.c4 import Board
+from c4.c4 import Colour
+from c4.c4 import Game
+
+MAGIC = b"C4OB"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sBHHHQ")
+_ENTRY = struct.Struct("<QhB")
+
+
+def _orient(board, column: int) -> int:
+    """
+    Convert column between board's orientation and the orientation of its
+    canonical key. Converting twice gives back the original column.
+    """
+    if board.key <= board.mirror_key:
+        return column
+    return board.columns - 1 - column
+
+
+def generate_book(
+    path: str,
+    depth: int,
+    rows: int = Game.DEFAULT_ROWS,
+    columns: int = Game.DEFAULT_COLUMNS,
+    goal: int = Game.GOAL,
+    search_depth: int = None,
+    time_budget: float = None,
+    table_size: int = 1 << 20,
+) -> int:
+    """
+    Write a book with the best move and score for every position up to depth
+    moves from the empty board, to path.
+    Positions are searched search_depth moves ahead, or to the end of the
+    game if search_depth is None, which gives solved scores but can take a
+    very long time on large boards.
+    Return the number of positions in the book.
+    """
+    board = Board(rows, columns, goal)
+    search = Search(table_size)
+    entries = {}
+
+    def visit(colour: Colour, other: Colour, ply: int):
+        key = board.canonical_key()
+        if key in entries:
+            return
+        column, score, _ = search.search(board, colour, time_budget, search_depth)
+        entries[key] = (score, _orient(board, column))
+        if ply == depth:
+            return
+        for column in board.legal_moves():
+            row = board.drop_piece(colour, column)
+            if not board.check_win(colour, row, column) and not board.is_full():
+                visit(other, colour, ply + 1)
+            board.undo(column)
+
+    visit(Colour.PLAYER_1, Colour.PLAYER_2, 0)
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, rows, columns, goal, len(entries)))
+        for key in sorted(entries):
+            score, column = entries[key]
+            f.write(_ENTRY.pack(key, score, column))
+    return len(entries)
+
+
+class OpeningBook:
+    """
+    Reads an opening book through mmap, so only the pages touched by the
+    binary search are loaded into memory.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.rows, self.columns, self.goal, self.count = (
+            _HEADER.unpack_from(self._map, 0)
+        )
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not an opening book")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _find(self, key: int) -> tuple:
+        """
+        Return the (score, column) entry for canonical key.
+        Return None if key is not in the book.
+        """
+        low = 0
+        high = self.count
+        while low < high:
+            middle = (low + high) // 2
+            offset = _HEADER.size + middle * _ENTRY.size
+            entry_key, score, column = _ENTRY.unpack_from(self._map, offset)
+            if entry_key < key:
+                low = middle + 1
+            elif entry_key > key:
+                high = middle
+            else:
+                return score, column
+        return None
+
+    def lookup(self, board) -> tuple:
+        """
+        Return a tuple of (column, score) for the player to move on board,
+        where column is the 0-based column to play.
+        Return None if the position is not in the book.
+        """
+        if (board.rows, board.columns, board.goal) != (
+            self.rows,
+            self.columns,
+            self.goal,
+        ):
+            return None
+        entry = self._find(board.canonical_key())
+        if entry is None:
+            return None
+        score, column = entry
+        return _orient(board, column), score
+
+    def close(self):
+        """
+        Release the memory map.
+        """
+        self._map.close()
+
+
+def main(argv: list = None):
+    """
+    Entry point for generating an opening book.
+    """
+    parser = argparse.ArgumentParser(description="Generate an opening book.")
+    parser.add_argument("path", help="file to write the book to")
+    parser.add_argument("depth", type=int, help="number of moves to cover")
+    parser.add_argument("--rows", type=int, default=Game.DEFAULT_ROWS)
+    parser.add_argument("--columns", type=int, default=Game.DEFAULT_COLUMNS)
+    parser.add_argument("--goal", type=int, default=Game.GOAL)
+    parser.add_argument(
+        "--search-depth",
+        type=int,
+        default=None,
+        help="moves to look ahead from each position, defaults to solving it",
+    )
+    parser.add_argument(
+        "--time",
+        type=float,
+        default=None,
+        help="seconds to spend on each position",
+    )
+    args = parser.parse_args(argv)
+
+    count = generate_book(
+        args.path,
+        args.depth,
+        rows=args.rows,
+        columns=args.columns,
+        goal=args.goal,
+        search_depth=args.search_depth,
+        time_budget=args.time,
+    )
+    print(f"Wrote {count} positions to {args.path}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
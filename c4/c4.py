@@ -7,9 +7,13 @@ Contact: chris@cplyon.ca
 Date: 2015-09-19
 """
 
+import argparse
 import sys
 from dataclasses import dataclass
 from enum import IntEnum
+from functools import lru_cache
+
+_MASK_64 = (1 << 64) - 1
 
 
 class Colour(IntEnum):
@@ -34,6 +38,53 @@ class Player:
     colour: Colour
 
 
+@dataclass
+class PlayResult:
+    """
+    The outcome of Game.play_many.
+    applied is the number of moves played, and winner is Game.winner after
+    them. stopped is the index of the column that was rejected or that ended
+    the game, or None if every column was played and the game is not over.
+    """
+
+    applied: int
+    winner: str
+    stopped: int
+
+
+def splitmix64(seed: int) -> int:
+    """
+    Return a well mixed 64-bit hash of seed.
+    """
+    seed = (seed + 0x9E3779B97F4A7C15) & _MASK_64
+    seed = ((seed ^ (seed >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+    seed = ((seed ^ (seed >> 27)) * 0x94D049BB133111EB) & _MASK_64
+    return seed ^ (seed >> 31)
+
+
+def zobrist_value(colour: Colour, row: int, column: int, columns: int) -> int:
+    """
+    Return the Zobrist hash value of a colour piece at row and column, on a
+    board with the given number of columns.
+    """
+    return splitmix64(2 * (row * columns + column) + colour - 1)
+
+
+@lru_cache(maxsize=None)
+def zobrist_table(rows: int, columns: int) -> tuple:
+    """
+    Return the Zobrist hash values for every cell of a board, indexed by
+    [colour][row * columns + column]. The values are fixed, so keys are
+    stable between runs and processes.
+    """
+    cells = [(r, c) for r in range(rows) for c in range(columns)]
+    return (
+        [0] * len(cells),
+        [zobrist_value(Colour.PLAYER_1, r, c, columns) for r, c in cells],
+        [zobrist_value(Colour.PLAYER_2, r, c, columns) for r, c in cells],
+    )
+
+
 class Board:
     """
     The game board, with customizable size
@@ -47,6 +98,15 @@ class Board:
         ]
         self.filled_cells = 0
         self.goal = goal
+        # number of pieces in each column, so the lowest empty cell of a column
+        # is at row (rows - height - 1)
+        self._heights = [0] * self.columns
+        self._legal_moves = tuple(range(self.columns))
+        # Zobrist hash of the position, and of its left-right mirror image.
+        # Both are kept up to date by drop_piece and undo only.
+        self._zobrist = zobrist_table(rows, columns)
+        self.key = 0
+        self.mirror_key = 0
 
     def __getitem__(self, key: int) -> Colour:
         """
@@ -65,6 +125,13 @@ class Board:
             printable_board += "\n"
         return printable_board
 
+    def canonical_key(self) -> int:
+        """
+        Return a position key that is the same for this board and its
+        left-right mirror image.
+        """
+        return min(self.key, self.mirror_key)
+
     def is_full(self) -> bool:
         """
         Return True if all cells on board have been filled.
@@ -77,7 +144,13 @@ class Board:
         Return True if top-most cell in column is not NONE
         Return False otherwise
         """
-        return self._board[0][column] is not Colour.NONE
+        return self._heights[column] == self.rows
+
+    def legal_moves(self) -> tuple:
+        """
+        Return the indices of all columns that are not full.
+        """
+        return self._legal_moves
 
     def drop_piece(self, colour: Colour, column: int) -> int:
         """
@@ -85,72 +158,134 @@ class Board:
         Return the row that was coloured.
         Return None if column is full.
         """
-        for row in reversed(range(self.rows)):
-            if self._board[row][column] is Colour.NONE:
-                # we found the lowest empty cell
-                self._board[row][column] = colour
-                self.filled_cells += 1
-                return row
+        height = self._heights[column]
+        if height == self.rows:
+            return None
+
+        row = self.rows - height - 1
+        self._board[row][column] = colour
+        self._heights[column] = height + 1
+        self.filled_cells += 1
+        values = self._zobrist[colour]
+        index = row * self.columns
+        self.key ^= values[index + column]
+        self.mirror_key ^= values[index + self.columns - 1 - column]
+        if row == 0:
+            # column just filled up. This happens at most once per column, so
+            # it's cheap to rebuild the legal moves here
+            self._legal_moves = tuple(c for c in self._legal_moves if c != column)
+        return row
+
+    def undo(self, column: int) -> int:
+        """
+        Remove the top-most piece from column.
+        Return the row that was cleared.
+        Return None if column is empty.
+        """
+        height = self._heights[column]
+        if height == 0:
+            return None
+
+        row = self.rows - height
+        values = self._zobrist[self._board[row][column]]
+        index = row * self.columns
+        self.key ^= values[index + column]
+        self.mirror_key ^= values[index + self.columns - 1 - column]
+        self._board[row][column] = Colour.NONE
+        self._heights[column] = height - 1
+        self.filled_cells -= 1
+        if row == 0:
+            # column is playable again
+            self._legal_moves = tuple(sorted(self._legal_moves + (column,)))
+        return row
+
+    def _streak_through(
+        self, colour: Colour, row: int, column: int, row_step: int, col_step: int
+    ) -> bool:
+        """
+        Return True if the cell at row and column is part of a streak of goal
+        or more cells along the direction (row_step, col_step).
+        Return False otherwise.
+        """
+        board = self._board
+        if board[row][column] is not colour:
+            return False
 
-        return None
+        # only a streak through this cell can be new, so count outwards from
+        # it in both directions and stop at the first mismatch. Neither side
+        # needs to look further than goal - 1 cells.
+        streak_length = 1
+        reach = self.goal - 1
+        r = row + row_step
+        c = column + col_step
+        while (
+            reach
+            and 0 <= r < self.rows
+            and 0 <= c < self.columns
+            and board[r][c] is colour
+        ):
+            streak_length += 1
+            reach -= 1
+            r += row_step
+            c += col_step
+        r = row - row_step
+        c = column - col_step
+        while (
+            reach
+            and 0 <= r < self.rows
+            and 0 <= c < self.columns
+            and board[r][c] is colour
+        ):
+            streak_length += 1
+            reach -= 1
+            r -= row_step
+            c -= col_step
+        return streak_length >= self.goal
+
+    def check_win(self, colour: Colour, row: int, column: int) -> bool:
+        """
+        Return True if the piece at row and column completes a streak of goal
+        or more cells horizontally, vertically or diagonally.
+        Return False otherwise.
+        """
+        return (
+            self.check_horizontal(colour, row, column)
+            or self.check_vertical(colour, row, column)
+            or self.check_top_left_to_bottom_right(colour, row, column)
+            or self.check_top_right_to_bottom_left(colour, row, column)
+        )
 
     def check_top_left_to_bottom_right(
         self, colour: Colour, row: int, column: int
     ) -> bool:
         """
-        Return True if there exists a diagonal streak of length or more cells
-        on the board in row.
+        Return True if there exists a diagonal streak of goal or more cells
+        through row and column.
         Return False otherwise.
         """
-        # need to check entire diagonal, since a piece could have been added in
-        # the middle of a streak
-        streak_length = 0
-        r = row - min(row, column)
-        c = column - min(row, column)
-        while r < self.rows and c < self.columns:
-            if self._board[r][c] is colour:
-                streak_length += 1
-                if streak_length >= self.goal:
-                    return True
-            else:
-                streak_length = 0
-            r += 1
-            c += 1
-        return False
+        return self._streak_through(colour, row, column, 1, 1)
 
     def check_top_right_to_bottom_left(
         self, colour: Colour, row: int, column: int
     ) -> bool:
         """
-        Return True if there exists a diagonal streak of length or more cells
-        on the board in row.
+        Return True if there exists a diagonal streak of goal or more cells
+        through row and column.
         Return False otherwise.
         """
-        # need to check entire diagonal, since a piece could have been added in
-        # the middle of a streak
-        streak_length = 0
-        r = row - min(row, self.columns - column - 1)
-        c = column + min(row, self.columns - column - 1)
-        while r < self.rows and c >= 0:
-            if self._board[r][c] is colour:
-                streak_length += 1
-                if streak_length == self.goal:
-                    return True
-            else:
-                streak_length = 0
-            r += 1
-            c -= 1
-        return False
+        return self._streak_through(colour, row, column, 1, -1)
 
-    def check_horizontal(self, colour: Colour, row: int) -> bool:
+    def check_horizontal(self, colour: Colour, row: int, column: int = None) -> bool:
         """
-        Return True if there exists a horizontal streak of length or more cells
-        on the board in row.
+        Return True if there exists a horizontal streak of goal or more cells
+        through row and column.
+        If column is None, look for a streak anywhere in row.
         Return False otherwise.
         """
+        if column is not None:
+            return self._streak_through(colour, row, column, 0, 1)
+
         streak_length = 0
-        # need to check entire row, since a piece could have been added in the
-        # middle of a streak
         for col in range(self.columns):
             if self._board[row][col] is colour:
                 streak_length += 1
@@ -195,12 +330,30 @@ class Game:
     DEFAULT_ROWS = 6
     GOAL = 4
 
-    def __init__(self):
-        self.player1 = Player(Player.PLAYER_1, Colour.PLAYER_1)
-        self.player2 = Player(Player.PLAYER_2, Colour.PLAYER_2)
-        self.board = Board(self.DEFAULT_ROWS, self.DEFAULT_COLUMNS, self.GOAL)
+    def __init__(
+        self,
+        board_class: type = Board,
+        player1: Player = None,
+        player2: Player = None,
+        rows: int = DEFAULT_ROWS,
+        columns: int = DEFAULT_COLUMNS,
+        goal: int = GOAL,
+    ):
+        """
+        board_class is the board implementation to play on. It is called with
+        (rows, columns, goal) and must provide the same interface as Board.
+        player1 and player2 replace the default human players, for example
+        with a computer player from c4.ai.
+        """
+        self.player1 = player1 or Player(Player.PLAYER_1, Colour.PLAYER_1)
+        self.player2 = player2 or Player(Player.PLAYER_2, Colour.PLAYER_2)
+        self.board = board_class(rows, columns, goal)
         self.winner = None
         self.turn = self.player1
+        # 0-based columns of every move played, most recent last
+        self.moves = []
+        # number of moves played when the winner was decided
+        self._decided_at = None
 
     def play(self, column: int) -> bool:
         """
@@ -210,28 +363,85 @@ class Game:
         Return True if piece was successfully placed into an empty cell.
         Return False if invalid or illegal column.
         """
+        column = self._parse_column(column)
+        if column is None:
+            return False
+
+        self._play_column(column)
+        return True
+
+    def _parse_column(self, column: int) -> int:
+        """
+        Convert 1-based user input to a 0-based column.
+        Return None if it is not a playable column.
+        """
         try:
             column = int(column) - 1
         except ValueError:
             # not a number
-            return False
+            return None
         if column < 0 or column >= self.board.columns:
             # out of bounds
-            return False
+            return None
         if self.board.is_column_full(column):
             # column is full
-            return False
+            return None
+        return column
 
+    def _play_column(self, column: int):
+        """
+        Play the current player's piece in 0-based column, which must not be
+        full.
+        """
         # drop current player's piece into column
         row = self.board.drop_piece(self.turn.colour, column)
+        self.moves.append(column)
 
         # check for winner.  There can be only one!
         if not self.winner:
             self.winner = self.determine_winner(self.turn.colour, row, column)
+            if self.winner:
+                self._decided_at = len(self.moves)
 
         # end turn
         self.turn = self.player2 if self.turn is self.player1 else self.player1
 
+    def play_many(self, columns) -> PlayResult:
+        """
+        Play a sequence of moves, given as 0-based integer columns like those
+        in Game.moves, in one pass.
+        Stop at the first column that is out of bounds or full, or once the
+        game is over.
+        Return a PlayResult.
+        """
+        board = self.board
+        width = board.columns
+        applied = 0
+        for index, column in enumerate(columns):
+            if self.winner or not 0 <= column < width or board.is_column_full(column):
+                return PlayResult(applied, self.winner, index)
+            self._play_column(column)
+            applied += 1
+            if self.winner:
+                return PlayResult(applied, self.winner, index)
+        return PlayResult(applied, self.winner, None)
+
+    def undo(self) -> bool:
+        """
+        Take back the last move, restoring the board, winner and turn to what
+        they were before it was played.
+        Return True if a move was taken back.
+        Return False if no moves have been played.
+        """
+        if not self.moves:
+            return False
+
+        if len(self.moves) == self._decided_at:
+            # this move decided the game
+            self.winner = None
+            self._decided_at = None
+        self.board.undo(self.moves.pop())
+        self.turn = self.player2 if self.turn is self.player1 else self.player1
         return True
 
     def determine_winner(self, colour: Colour, row: int, column: int) -> Player:
@@ -242,12 +452,7 @@ class Game:
         Return None if game is not over.
         """
 
-        if (
-            self.board.check_horizontal(colour, row)
-            or self.board.check_vertical(colour, row, column)
-            or self.board.check_top_left_to_bottom_right(colour, row, column)
-            or self.board.check_top_right_to_bottom_left(colour, row, column)
-        ):
+        if self.board.check_win(colour, row, column):
             return self.turn.name
 
         if self.board.is_full():
@@ -258,18 +463,47 @@ class Game:
         return None
 
 
-def main():
+def main(argv: list = None):
     """
     Entry point for the game
     """
-    game = Game()
+    parser = argparse.ArgumentParser(description="Play Connect Four.")
+    parser.add_argument(
+        "--computer",
+        type=int,
+        choices=(1, 2),
+        help="let the computer play as player 1 or 2",
+    )
+    parser.add_argument(
+        "--think-time",
+        type=float,
+        default=1.0,
+        help="seconds the computer may spend on each move",
+    )
+    args = parser.parse_args(argv)
+
+    players = {}
+    if args.computer:
+        # imported here, since c4.ai depends on this module
+        from c4.ai import AIPlayer
+
+        colour = Colour(args.computer)
+        name = Player.PLAYER_1 if colour is Colour.PLAYER_1 else Player.PLAYER_2
+        players[f"player{args.computer}"] = AIPlayer(
+            name, colour, time_budget=args.think_time
+        )
+    game = Game(**players)
 
     # game loop
     while True:
         print()
         print(game.board)
         print(f"{game.turn.name} choose a column:")
-        user_input = sys.stdin.readline().strip()
+        if hasattr(game.turn, "choose_move"):
+            user_input = game.turn.choose_move(game)
+            print(user_input)
+        else:
+            user_input = sys.stdin.readline().strip()
         if str(user_input).lower() == "q":
             sys.exit(0)
         if not game.play(user_input):
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+
+"""
+Compact binary storage for finished Connect Four games.
+Author: Chris Lyon
+Contact: chris@cplyon.ca
+Date: 2026-10-17
+
+File layout, all integers little-endian:
+
+    header   magic "C4GR", version (u8), bits per move (u8),
+             rows (u16), columns (u16), goal (u16)
+    games    for each game, its number of moves as a LEB128 varint, then its
+             0-based columns packed bits per move, first move in the lowest
+             bits, padded to a whole byte
+    index    offset (u64) of every INDEX_INTERVAL-th game
+    trailer  offset of the index (u64), number of games (u64)
+"""
+
+import mmap
+import struct
+from array import array
+
+from c4.c4 import Game
+
+MAGIC = b"C4GR"
+VERSION = 1
+INDEX_INTERVAL = 64
+
+_HEADER = struct.Struct("<4sBBHHH")
+_TRAILER = struct.Struct("<QQ")
+
+
+def bits_per_move(columns: int) -> int:
+    """
+    Return the number of bits needed to store a 0-based column index.
+    """
+    return max(1, (columns - 1).bit_length())
+
+
+def encode_moves(moves: list, bits: int) -> bytes:
+    """
+    Return moves packed into bits bits each, padded to a whole byte.
+    """
+    packed = 0
+    shift = 0
+    for column in moves:
+        packed |= column << shift
+        shift += bits
+    return packed.to_bytes((shift + 7) // 8, "little")
+
+
+def decode_moves(data: bytes, count: int, bits: int) -> list:
+    """
+    Return the first count moves packed into data by encode_moves.
+    """
+    packed = int.from_bytes(data, "little")
+    mask = (1 << bits) - 1
+    return [(packed >> (i * bits)) & mask for i in range(count)]
+
+
+def _encode_varint(value: int) -> bytes:
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _decode_varint(data, offset: int) -> tuple:
+    """
+    Return the varint at offset in data, and the offset just past it.
+    """
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+class RecordWriter:
+    """
+    Writes games to a new record file. Use as a context manager, or call
+    close when done; the file is not readable until it has been closed.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        rows: int = Game.DEFAULT_ROWS,
+        columns: int = Game.DEFAULT_COLUMNS,
+        goal: int = Game.GOAL,
+    ):
+        self.rows = rows
+        self.columns = columns
+        self.goal = goal
+        self.bits = bits_per_move(columns)
+        self.count = 0
+        self._file = open(path, "wb")
+        self._file.write(
+            _HEADER.pack(MAGIC, VERSION, self.bits, rows, columns, goal)
+        )
+        self._offset = _HEADER.size
+        self._index = array("Q")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, moves: list):
+        """
+        Append a game, given as the 0-based columns of its moves.
+        """
+        if self.count % INDEX_INTERVAL == 0:
+            self._index.append(self._offset)
+        data = _encode_varint(len(moves)) + encode_moves(moves, self.bits)
+        self._file.write(data)
+        self._offset += len(data)
+        self.count += 1
+
+    def write_game(self, game: Game):
+        """
+        Append the moves played so far in game.
+        """
+        self.write(game.moves)
+
+    def close(self):
+        """
+        Write the index and trailer, and close the file.
+        """
+        if self._file.closed:
+            return
+        self._file.write(self._index.tobytes())
+        self._file.write(_TRAILER.pack(self._offset, self.count))
+        self._file.close()
+
+
+class RecordReader:
+    """
+    Reads games from a record file through mmap, so only the pages holding
+    the games that are read are loaded into memory.
+    Supports len(), iteration, and indexing to get the moves of one game.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.bits, self.rows, self.columns, self.goal = (
+            _HEADER.unpack_from(self._map, 0)
+        )
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a game record file")
+        index_offset, self.count = _TRAILER.unpack_from(
+            self._map, len(self._map) - _TRAILER.size
+        )
+        blocks = (self.count + INDEX_INTERVAL - 1) // INDEX_INTERVAL
+        self._index = memoryview(self._map)[
+            index_offset : index_offset + blocks * 8
+        ].cast("Q")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _read(self, offset: int) -> tuple:
+        """
+        Return the moves of the game at offset, and the offset of the next.
+        """
+        count, offset = _decode_varint(self._map, offset)
+        end = offset + (count * self.bits + 7) // 8
+        return decode_moves(self._map[offset:end], count, self.bits), end
+
+    def __getitem__(self, key: int) -> list:
+        """
+        Return the 0-based columns of the moves of game key.
+        """
+        if key < 0:
+            key += self.count
+        if not 0 <= key < self.count:
+            raise IndexError("game index out of range")
+        offset = self._index[key // INDEX_INTERVAL]
+        # skip over the games between the indexed one and this one
+        for _ in range(key % INDEX_INTERVAL):
+            count, offset = _decode_varint(self._map, offset)
+            offset += (count * self.bits + 7) // 8
+        return self._read(offset)[0]
+
+    def __iter__(self):
+        offset = _HEADER.size
+        for _ in range(self.count):
+            moves, offset = self._read(offset)
+            yield moves
+
+    def game(self, key: int) -> Game:
+        """
+        Return a Game with the moves of game key replayed through
+        Game.play_many.
+        """
+        game = Game(rows=self.rows, columns=self.columns, goal=self.goal)
+        game.play_many(self[key])
+        return game
+
+    def close(self):
+        """
+        Release the memory map.
+        """
+        self._index.release()
+        self._map.close()
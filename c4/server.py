@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+
+"""
+asyncio server hosting many concurrent Connect Four games over TCP.
+Author: Chris Lyon
+Contact: chris@cplyon.ca
+Date: 2026-10-17
+
+Players connect and are paired in the order they arrive. The protocol is one
+line of text per message. The server sends:
+
+    WAITING            waiting for an opponent to connect
+    START <n>          the game has started, and you are player n
+    YOUR_TURN          send the column to play, as a 1-based number
+    INVALID            that column can't be played, try again
+    MOVE <n> <column>  player n played in column
+    WINNER <n>         player n won, and the game is over
+    TIE                the board is full, and the game is over
+    ABANDONED          your opponent left, and the game is over
+    TIMEOUT            nobody moved for too long, and the game is over
+    BUSY               the server is full, try again later
+
+Players send a column number, exactly as typed into main(), or q to quit.
+"""
+
+import argparse
+import asyncio
+import sys
+
+from c4.c4 import Colour
+from c4.c4 import Game
+
+# longest line a client may send
+MAX_LINE = 64
+
+
+class _Seat:
+    """
+    A connected player.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.paired = asyncio.Event()
+        self.finished = asyncio.Event()
+
+
+class GameServer:
+    """
+    Runs every game on one event loop. Each game is driven by a single task
+    that only reads from the player whose turn it is, so a game costs no more
+    than that task and its two connections.
+    """
+
+    def __init__(
+        self,
+        idle_timeout: float = 300.0,
+        max_connections: int = None,
+        rows: int = Game.DEFAULT_ROWS,
+        columns: int = Game.DEFAULT_COLUMNS,
+        goal: int = Game.GOAL,
+    ):
+        self.idle_timeout = idle_timeout
+        self.max_connections = max_connections
+        self.rows = rows
+        self.columns = columns
+        self.goal = goal
+        self.connections = 0
+        self.games_played = 0
+        self._waiting = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0):
+        """
+        Start listening for players.
+        Return the asyncio Server.
+        """
+        return await asyncio.start_server(self._handle, host, port, limit=MAX_LINE)
+
+    async def _send(self, seat: _Seat, message: str) -> bool:
+        """
+        Send message to seat, waiting for the connection to drain so a slow
+        reader can't make the server buffer without limit.
+        Return False if the player could not be reached.
+        """
+        try:
+            seat.writer.write(message.encode() + b"\n")
+            await asyncio.wait_for(seat.writer.drain(), self.idle_timeout)
+        except (ConnectionError, asyncio.TimeoutError):
+            return False
+        return True
+
+    async def _close(self, seat: _Seat):
+        seat.writer.close()
+        try:
+            await seat.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        seat = _Seat(reader, writer)
+        if self.max_connections is not None and (
+            self.connections >= self.max_connections
+        ):
+            await self._send(seat, "BUSY")
+            await self._close(seat)
+            return
+
+        self.connections += 1
+        try:
+            if self._waiting is None:
+                await self._wait_for_opponent(seat)
+            else:
+                opponent = self._waiting
+                self._waiting = None
+                opponent.paired.set()
+                try:
+                    await self._run_game(opponent, seat)
+                finally:
+                    opponent.finished.set()
+                    await self._close(seat)
+        finally:
+            self.connections -= 1
+
+    async def _wait_for_opponent(self, seat: _Seat):
+        self._waiting = seat
+        await self._send(seat, "WAITING")
+        try:
+            await asyncio.wait_for(seat.paired.wait(), self.idle_timeout)
+        except asyncio.TimeoutError:
+            if self._waiting is seat:
+                self._waiting = None
+            await self._send(seat, "TIMEOUT")
+            await self._close(seat)
+            return
+        # the opponent's task runs the game
+        await seat.finished.wait()
+        await self._close(seat)
+
+    async def _run_game(self, first: _Seat, second: _Seat):
+        game = Game(rows=self.rows, columns=self.columns, goal=self.goal)
+        seats = {Colour.PLAYER_1: first, Colour.PLAYER_2: second}
+        await self._send(first, f"START {int(Colour.PLAYER_1)}")
+        await self._send(second, f"START {int(Colour.PLAYER_2)}")
+
+        while True:
+            colour = game.turn.colour
+            seat = seats[colour]
+            other = second if seat is first else first
+            await self._send(seat, "YOUR_TURN")
+            try:
+                line = await asyncio.wait_for(
+                    seat.reader.readline(), self.idle_timeout
+                )
+            except asyncio.TimeoutError:
+                await self._send(seat, "TIMEOUT")
+                await self._send(other, "TIMEOUT")
+                return
+            except (ConnectionError, ValueError):
+                # ValueError means the line was longer than MAX_LINE
+                line = b""
+
+            user_input = line.decode(errors="replace").strip()
+            if not line or user_input.lower() == "q":
+                await self._send(other, "ABANDONED")
+                return
+            if not game.play(user_input):
+                await self._send(seat, "INVALID")
+                continue
+
+            move = f"MOVE {int(colour)} {game.moves[-1] + 1}"
+            await self._send(first, move)
+            await self._send(second, move)
+            if game.winner:
+                if game.winner == Game.TIE:
+                    result = "TIE"
+                else:
+                    result = f"WINNER {int(colour)}"
+                await self._send(first, result)
+                await self._send(second, result)
+                self.games_played += 1
+                return
+
+
+async def play_client(host: str, port: int, columns: list) -> list:
+    """
+    Connect to a server and play columns, in order, whenever it's our turn.
+    Send q once the columns run out.
+    Return every line received from the server.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    columns = iter(columns)
+    transcript = []
+    while True:
+        line = await reader.readline()
+        if not line:
+            break
+        message = line.decode().strip()
+        transcript.append(message)
+        if message == "YOUR_TURN":
+            writer.write(f"{next(columns, 'q')}\n".encode())
+            await writer.drain()
+    writer.close()
+    await writer.wait_closed()
+    return transcript
+
+
+async def serve(host: str, port: int, server: GameServer):
+    """
+    Run server until cancelled.
+    """
+    listener = await server.start(host, port)
+    async with listener:
+        await listener.serve_forever()
+
+
+def main(argv: list = None):
+    """
+    Entry point for the game server.
+    """
+    parser = argparse.ArgumentParser(description="Host Connect Four games.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4444)
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=300.0,
+        help="seconds a player may take to move, or wait for an opponent",
+    )
+    parser.add_argument("--max-connections", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    server = GameServer(args.idle_timeout, args.max_connections)
+    try:
+        asyncio.run(serve(args.host, args.port, server))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+
+"""
+Batch self-play simulation of Connect Four games across a process pool.
+Author: Chris Lyon
+Contact: chris@cplyon.ca
+Date: 2026-10-17
+"""
+
+import argparse
+import json
+import multiprocessing
+import random
+import sys
+from dataclasses import dataclass
+
+from c4.c4 import Colour
+from c4.c4 import Game
+
+
+@dataclass
+class GameResult:
+    """
+    The outcome of one simulated game.
+    winner is Colour.NONE for a tie, and moves holds the 0-based column of
+    every move in the order they were played.
+    """
+
+    index: int
+    winner: Colour
+    moves: list
+
+    @property
+    def length(self) -> int:
+        return len(self.moves)
+
+
+def random_policy(game: Game, rng: random.Random) -> int:
+    """
+    Return a random legal column.
+    """
+    return rng.choice(game.board.legal_moves())
+
+
+def centre_policy(game: Game, rng: random.Random) -> int:
+    """
+    Return the legal column closest to the centre, breaking ties at random.
+    """
+    centre = (game.board.columns - 1) / 2
+    moves = game.board.legal_moves()
+    closest = min(abs(c - centre) for c in moves)
+    return rng.choice([c for c in moves if abs(c - centre) == closest])
+
+
+def greedy_policy(game: Game, rng: random.Random) -> int:
+    """
+    Return a column that wins immediately, or one that stops the opponent
+    from winning immediately. Otherwise return a random legal column.
+    """
+    board = game.board
+    moves = board.legal_moves()
+    colour = game.turn.colour
+    other = Colour.PLAYER_2 if colour is Colour.PLAYER_1 else Colour.PLAYER_1
+    for player in (colour, other):
+        for column in moves:
+            row = board.drop_piece(player, column)
+            won = board.check_win(player, row, column)
+            board.undo(column)
+            if won:
+                return column
+    return rng.choice(moves)
+
+
+POLICIES = {
+    "random": random_policy,
+    "centre": centre_policy,
+    "greedy": greedy_policy,
+}
+
+
+def play_game(
+    index: int,
+    seed: int,
+    rows: int = Game.DEFAULT_ROWS,
+    columns: int = Game.DEFAULT_COLUMNS,
+    goal: int = Game.GOAL,
+    policy: str = "random",
+) -> GameResult:
+    """
+    Play game number index of the batch started with seed to the end, with
+    both players using policy.
+    Each game has its own random generator, seeded from (seed, index), so a
+    game plays out the same no matter which process runs it.
+    """
+    rng = random.Random(f"{seed}:{index}")
+    choose = POLICIES[policy]
+    game = Game(rows=rows, columns=columns, goal=goal)
+    while not game.winner:
+        game.play(choose(game, rng) + 1)
+
+    if game.winner == Game.TIE:
+        winner = Colour.NONE
+    elif game.winner == game.player1.name:
+        winner = game.player1.colour
+    else:
+        winner = game.player2.colour
+    return GameResult(index, winner, game.moves)
+
+
+def _play_chunk(args: tuple) -> list:
+    start, stop, seed, rows, columns, goal, policy = args
+    return [
+        play_game(index, seed, rows, columns, goal, policy)
+        for index in range(start, stop)
+    ]
+
+
+def simulate(
+    games: int,
+    rows: int = Game.DEFAULT_ROWS,
+    columns: int = Game.DEFAULT_COLUMNS,
+    goal: int = Game.GOAL,
+    policy: str = "random",
+    seed: int = 0,
+    workers: int = None,
+    chunk_size: int = 100,
+):
+    """
+    Play games games, and yield their results in lists of up to chunk_size,
+    in game order.
+    workers is the number of processes to use, defaulting to one per CPU.
+    The results depend only on the arguments other than workers and
+    chunk_size.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"unknown policy: {policy}")
+    chunks = (
+        (start, min(start + chunk_size, games), seed, rows, columns, goal, policy)
+        for start in range(0, games, chunk_size)
+    )
+    if workers == 1:
+        # no need for the overhead of a pool
+        yield from map(_play_chunk, chunks)
+        return
+
+    with multiprocessing.Pool(workers) as pool:
+        yield from pool.imap(_play_chunk, chunks)
+
+
+def main(argv: list = None):
+    """
+    Entry point for batch simulation. Writes one JSON object per game to
+    stdout.
+    """
+    parser = argparse.ArgumentParser(description="Simulate Connect Four games.")
+    parser.add_argument("games", type=int, help="number of games to play")
+    parser.add_argument("--rows", type=int, default=Game.DEFAULT_ROWS)
+    parser.add_argument("--columns", type=int, default=Game.DEFAULT_COLUMNS)
+    parser.add_argument("--goal", type=int, default=Game.GOAL)
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="random")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--workers", type=int, default=None, help="defaults to one per CPU"
+    )
+    parser.add_argument("--chunk-size", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    for chunk in simulate(
+        args.games,
+        rows=args.rows,
+        columns=args.columns,
+        goal=args.goal,
+        policy=args.policy,
+        seed=args.seed,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+    ):
+        for result in chunk:
+            record = {
+                "game": result.index,
+                "winner": int(result.winner),
+                "length": result.length,
+                "moves": result.moves,
+            }
+            sys.stdout.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
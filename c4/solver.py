@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+
+"""
+Perfect-play Connect Four solver.
+Author: Chris Lyon
+Contact: chris@cplyon.ca
+Date: 2026-10-17
+
+Positions are encoded as two bitboards, laid out like c4.bitboard.BitBoard:
+the pieces of the player to move, and a mask of every piece on the board.
+Their sum identifies the position and fits in 64 bits for boards of up to 64
+cells including one guard bit per column, which covers the standard 7x6 board.
+
+Scores follow the usual convention for the player to move: 0 for a tie, and
+for a win, one more than the number of pieces the winner has left after
+their winning move. Losses are the negative of the opponent's win.
+"""
+
+import mmap
+import os
+import struct
+from array import array
+from dataclasses import dataclass
+
+from c4.bitboard import has_streak
+from c4.c4 import Colour
+from c4.c4 import Game
+
+MAGIC = b"C4TT"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sB3xHHH2xQ")
+
+
+def encode(board) -> tuple:
+    """
+    Return (pieces of the player to move, mask of all pieces, moves played)
+    for board. The player to move is PLAYER_1 after an even number of moves.
+    """
+    height = board.rows + 1
+    current = Colour.PLAYER_1 if board.filled_cells % 2 == 0 else Colour.PLAYER_2
+    position = 0
+    mask = 0
+    for column in range(board.columns):
+        for h in range(board.rows):
+            colour = board[board.rows - 1 - h][column]
+            if colour == Colour.NONE:
+                break
+            bit = 1 << (column * height + h)
+            mask |= bit
+            if colour == current:
+                position |= bit
+    return position, mask, board.filled_cells
+
+
+class TranspositionTable:
+    """
+    Fixed-size, lossy table of upper bounds on position scores. A new entry
+    replaces whatever was stored in its slot.
+    If path is given the table lives in that file, through mmap, so that
+    later runs, including in other processes, start with what was learned.
+    """
+
+    def __init__(
+        self,
+        rows: int,
+        columns: int,
+        goal: int,
+        size: int = 1000003,
+        path: str = None,
+    ):
+        self.size = size
+        self._map = None
+        if path is None:
+            self._keys = array("Q", bytes(8 * size))
+            self._values = bytearray(size)
+            return
+
+        header = _HEADER.pack(MAGIC, VERSION, rows, columns, goal, size)
+        length = _HEADER.size + 9 * size
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            with open(path, "rb") as f:
+                if f.read(_HEADER.size) != header:
+                    raise ValueError(
+                        f"{path} is not a transposition table for this board"
+                    )
+            fd = os.open(path, os.O_RDWR)
+        else:
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+            os.write(fd, header)
+            os.ftruncate(fd, length)
+        try:
+            self._map = mmap.mmap(fd, length)
+        finally:
+            os.close(fd)
+        # the header is a multiple of 8 bytes, so the keys stay aligned
+        view = memoryview(self._map)
+        self._keys = view[_HEADER.size : _HEADER.size + 8 * size].cast("Q")
+        self._values = view[_HEADER.size + 8 * size :]
+
+    def get(self, key: int) -> int:
+        """
+        Return the value stored for key.
+        Return 0 if key is not in the table.
+        """
+        index = key % self.size
+        if self._keys[index] == key:
+            return self._values[index]
+        return 0
+
+    def put(self, key: int, value: int):
+        """
+        Store value, between 1 and 255, for key.
+        """
+        index = key % self.size
+        self._keys[index] = key
+        self._values[index] = value
+
+    def close(self):
+        """
+        Write the table back to its file, if it has one, and release it.
+        """
+        if self._map is None:
+            return
+        self._keys.release()
+        self._values.release()
+        self._map.flush()
+        self._map.close()
+        self._map = None
+
+
+@dataclass
+class Solution:
+    """
+    The result of perfect play from a position.
+    winner is Colour.NONE for a tie, and moves is the number of moves, by
+    both players, until the game ends.
+    """
+
+    score: int
+    winner: Colour
+    moves: int
+
+
+class Solver:
+    """
+    Solves positions with null-window negamax searches, alpha-beta pruning,
+    centre-first move ordering and a transposition table of upper bounds.
+    """
+
+    def __init__(
+        self,
+        rows: int = Game.DEFAULT_ROWS,
+        columns: int = Game.DEFAULT_COLUMNS,
+        goal: int = Game.GOAL,
+        table_size: int = 1000003,
+        path: str = None,
+    ):
+        if (rows + 1) * columns > 64:
+            raise ValueError("board is too large to encode in 64 bits")
+        self.rows = rows
+        self.columns = columns
+        self.goal = goal
+        self.nodes = 0
+        self.cells = rows * columns
+        # scores lie in [min_score, max_score], and are stored in the table
+        # shifted to start at 1, since 0 means empty
+        self.min_score = -(self.cells // 2)
+        self.max_score = (self.cells + 1) // 2
+        self.table = TranspositionTable(rows, columns, goal, table_size, path)
+
+        height = rows + 1
+        self._height = height
+        self._bottom = [1 << (c * height) for c in range(columns)]
+        self._top = [1 << (c * height + rows - 1) for c in range(columns)]
+        self._column = [((1 << rows) - 1) << (c * height) for c in range(columns)]
+        centre = (columns - 1) / 2
+        self._order = sorted(range(columns), key=lambda c: abs(c - centre))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Save and release the transposition table.
+        """
+        self.table.close()
+
+    def _is_win(self, position: int) -> bool:
+        height = self._height
+        goal = self.goal
+        return (
+            has_streak(position, 1, goal)
+            or has_streak(position, height, goal)
+            or has_streak(position, height - 1, goal)
+            or has_streak(position, height + 1, goal)
+        )
+
+    def _wins(self, position: int, mask: int, column: int) -> bool:
+        """
+        Return True if the player to move wins by playing column.
+        """
+        piece = (mask + self._bottom[column]) & self._column[column]
+        return self._is_win(position | piece)
+
+    def _negamax(
+        self, position: int, mask: int, moves: int, alpha: int, beta: int
+    ) -> int:
+        self.nodes += 1
+        if moves == self.cells:
+            return 0
+
+        playable = [c for c in self._order if not mask & self._top[c]]
+        for column in playable:
+            if self._wins(position, mask, column):
+                return (self.cells + 1 - moves) // 2
+
+        # we can't win with this move, so at best we win with our next one
+        upper = (self.cells - 1 - moves) // 2
+        stored = self.table.get(position + mask)
+        if stored:
+            upper = stored + self.min_score - 1
+        if beta > upper:
+            beta = upper
+            if alpha >= beta:
+                return beta
+
+        for column in playable:
+            child = mask | (mask + self._bottom[column])
+            score = -self._negamax(position ^ mask, child, moves + 1, -beta, -alpha)
+            if score >= beta:
+                return score
+            if score > alpha:
+                alpha = score
+
+        self.table.put(position + mask, alpha - self.min_score + 1)
+        return alpha
+
+    def _solve(self, position: int, mask: int, moves: int) -> int:
+        """
+        Return the exact score of a position, narrowing the range of possible
+        scores with null-window searches.
+        """
+        low = -(self.cells - moves) // 2
+        high = (self.cells + 1 - moves) // 2
+        while low < high:
+            middle = low + (high - low) // 2
+            # bias the guesses towards 0, where most positions are decided
+            if middle <= 0 and low // 2 < middle:
+                middle = low // 2
+            elif middle >= 0 and high // 2 > middle:
+                middle = high // 2
+            score = self._negamax(position, mask, moves, middle, middle + 1)
+            if score <= middle:
+                high = score
+            else:
+                low = score
+        return low
+
+    def _check(self, position):
+        """
+        Return the board of position, which is a Board or a Game.
+        """
+        board = position
+        if isinstance(position, Game):
+            if position.winner:
+                raise ValueError("the game is already over")
+            board = position.board
+        if (board.rows, board.columns, board.goal) != (
+            self.rows,
+            self.columns,
+            self.goal,
+        ):
+            raise ValueError("board does not match the solver")
+        return board
+
+    def solve(self, position) -> Solution:
+        """
+        Solve position, which is a Board or a Game that is not over, for the
+        player to move.
+        Return a Solution.
+        """
+        board = self._check(position)
+        position, mask, moves = encode(board)
+        score = self._solve(position, mask, moves)
+        current = Colour.PLAYER_1 if moves % 2 == 0 else Colour.PLAYER_2
+        if score == 0:
+            return Solution(0, Colour.NONE, self.cells - moves)
+
+        if score > 0:
+            winner = current
+            parity = moves % 2
+        else:
+            winner = Colour.PLAYER_2 if current is Colour.PLAYER_1 else Colour.PLAYER_1
+            parity = (moves + 1) % 2
+        # the winning piece is dropped when there are n pieces on the board,
+        # where n has the winner's parity and (cells + 1 - n) // 2 == |score|
+        n = self.cells + 1 - 2 * abs(score)
+        if n % 2 != parity:
+            n -= 1
+        return Solution(score, winner, n - moves + 1)
+
+    def best_move(self, position) -> tuple:
+        """
+        Return (column, score) of the best 0-based column for the player to
+        move on position, which is a Board or a Game that is not over.
+        """
+        board = self._check(position)
+        position, mask, moves = encode(board)
+        best = None
+        for column in self._order:
+            if mask & self._top[column]:
+                continue
+            if self._wins(position, mask, column):
+                return column, (self.cells + 1 - moves) // 2
+            child = mask | (mask + self._bottom[column])
+            if moves + 1 == self.cells:
+                score = 0
+            else:
+                score = -self._solve(position ^ mask, child, moves + 1)
+            if best is None or score > best[1]:
+                best = column, score
+        return best
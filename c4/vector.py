@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+
+"""
+NumPy engine that plays many Connect Four games in lockstep.
+Author: Chris Lyon
+Contact: chris@cplyon.ca
+Date: 2026-10-17
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from c4.c4 import Colour
+from c4.c4 import Game
+
+
+def find_streaks(mask: np.ndarray, goal: int) -> np.ndarray:
+    """
+    mask is a boolean array of shape (boards, rows, columns).
+    Return a boolean array of shape (boards,) which is True for each board
+    with goal or more True cells in a row horizontally, vertically or
+    diagonally.
+    """
+    boards, rows, columns = mask.shape
+    found = np.zeros(boards, dtype=bool)
+    if columns >= goal:
+        windows = sliding_window_view(mask, goal, axis=2)
+        found |= windows.all(axis=-1).any(axis=(1, 2))
+    if rows >= goal:
+        windows = sliding_window_view(mask, goal, axis=1)
+        found |= windows.all(axis=-1).any(axis=(1, 2))
+    if rows >= goal and columns >= goal:
+        # AND together goal shifted copies of the board, one per cell of the
+        # diagonal. What's left marks the top end of every diagonal streak.
+        height = rows - goal + 1
+        width = columns - goal + 1
+        down = mask[:, :height, :width].copy()
+        up = mask[:, :height, goal - 1 :].copy()
+        for i in range(1, goal):
+            down &= mask[:, i : height + i, i : width + i]
+            up &= mask[:, i : height + i, goal - 1 - i : columns - i]
+        found |= down.any(axis=(1, 2)) | up.any(axis=(1, 2))
+    return found
+
+
+class GameBatch:
+    """
+    A batch of games on boards of the same size, stored in one array of shape
+    (boards, rows, columns) and played one move per board per step.
+    The rules are the same as Game: a game ends as soon as a player makes a
+    streak of goal, or the board is full.
+    """
+
+    def __init__(
+        self,
+        boards: int,
+        rows: int = Game.DEFAULT_ROWS,
+        columns: int = Game.DEFAULT_COLUMNS,
+        goal: int = Game.GOAL,
+    ):
+        self.boards = boards
+        self.rows = rows
+        self.columns = columns
+        self.goal = goal
+        self.cells = np.zeros((boards, rows, columns), dtype=np.int8)
+        # number of pieces in each column of each board
+        self.heights = np.zeros((boards, columns), dtype=np.int32)
+        self.filled_cells = np.zeros(boards, dtype=np.int32)
+        self.turn = np.full(boards, Colour.PLAYER_1, dtype=np.int8)
+        # Colour of the winner. Colour.NONE for games still in progress and
+        # for ties, which can be told apart with done.
+        self.winner = np.zeros(boards, dtype=np.int8)
+        self.done = np.zeros(boards, dtype=bool)
+        # 0-based column of every move played, -1 past the end of the game
+        self.moves = np.full((boards, rows * columns), -1, dtype=np.int16)
+
+    def legal_moves(self) -> np.ndarray:
+        """
+        Return a boolean array of shape (boards, columns), which is True for
+        every column that can be played in a game that is not over.
+        """
+        return (self.heights < self.rows) & ~self.done[:, None]
+
+    def step(self, columns) -> np.ndarray:
+        """
+        Play one move in every game, in the 0-based column given for that
+        game. Moves in games that are over, and moves into full or out of
+        bounds columns, are ignored and do not end the turn.
+        Return a boolean array which is True for each game a move was played
+        in.
+        """
+        columns = np.asarray(columns)
+        in_bounds = (columns >= 0) & (columns < self.columns)
+        columns = np.where(in_bounds, columns, 0)
+        index = np.arange(self.boards)
+        heights = self.heights[index, columns]
+        played = in_bounds & ~self.done & (heights < self.rows)
+
+        index = index[played]
+        columns = columns[played]
+        heights = heights[played]
+        colours = self.turn[index]
+        self.cells[index, self.rows - 1 - heights, columns] = colours
+        self.heights[index, columns] += 1
+        self.moves[index, self.filled_cells[index]] = columns
+        self.filled_cells[index] += 1
+
+        # only the player who just moved can have won
+        mask = self.cells[index] == colours[:, None, None]
+        won = find_streaks(mask, self.goal)
+        self.winner[index[won]] = colours[won]
+        full = self.filled_cells[index] == self.rows * self.columns
+        self.done[index] = won | full
+        self.turn[index] = np.where(
+            colours == Colour.PLAYER_1, Colour.PLAYER_2, Colour.PLAYER_1
+        )
+        return played
+
+    def play_random(self, rng: np.random.Generator = None) -> np.ndarray:
+        """
+        Play random legal moves in every game until they are all over.
+        Return the winner array.
+        """
+        if rng is None:
+            rng = np.random.default_rng()
+        while not self.done.all():
+            # the highest random score among the legal columns is a uniform
+            # choice of legal column
+            scores = rng.random((self.boards, self.columns))
+            scores[~self.legal_moves()] = -1.0
+            self.step(scores.argmax(axis=1))
+        return self.winner
+
+    def game_moves(self, board: int) -> list:
+        """
+        Return the 0-based columns played in one game, in order.
+        """
+        return self.moves[board, : self.filled_cells[board]].tolist()
@@ -13,4 +13,5 @@ setup(
    author_email='chris@cplyon.ca',
    packages=['c4'],
    install_requires=[''],
+   extras_require={'numpy': ['numpy']},
 )
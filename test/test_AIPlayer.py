@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+"""
+Tests for the computer Connect Four player.
+Author: Chris Lyon
+Contact: chris@cplyon.ca
+Date: 2026-10-17
+"""
+
+import logging
+import sys
+import unittest
+
+from c4.ai import AIPlayer
+from c4.ai import Search
+from c4.ai import TranspositionTable
+from c4.bitboard import BitBoard
+from c4.c4 import Colour
+from c4.c4 import Game
+from c4.c4 import Player
+
+
+class AIPlayerTest(unittest.TestCase):
+
+    def test_transposition_table(self):
+        table = TranspositionTable(8)
+        self.assertIsNone(table.get(3))
+        table.put(3, (1, 0, 5, 2))
+        self.assertEqual(table.get(3), (1, 0, 5, 2))
+        # same slot, so the old entry is replaced
+        table.put(11, (2, 0, 0, 1))
+        self.assertIsNone(table.get(3))
+        self.assertEqual(table.get(11), (2, 0, 0, 1))
+        table.clear()
+        self.assertIsNone(table.get(11))
+
+    def test_takes_winning_move(self):
+        game = Game()
+        for column in [1, 1, 2, 2, 3, 3]:
+            game.play(column)
+        ai = AIPlayer(Player.PLAYER_1, Colour.PLAYER_1, max_depth=4)
+        self.assertEqual(ai.choose_move(game), 4)
+
+    def test_blocks_losing_move(self):
+        game = Game()
+        for column in [1, 7, 1, 7, 1]:
+            game.play(column)
+        ai = AIPlayer(Player.PLAYER_2, Colour.PLAYER_2, max_depth=4)
+        self.assertEqual(ai.choose_move(game), 1)
+
+    def test_search_restores_board(self):
+        game = Game()
+        for column in [4, 4, 3, 5]:
+            game.play(column)
+        before = str(game.board)
+        search = Search(1 << 10)
+        column, score, depth = search.search(
+            game.board, game.turn.colour, max_depth=5)
+        self.assertIn(column, game.board.legal_moves())
+        self.assertEqual(depth, 5)
+        self.assertEqual(str(game.board), before)
+        self.assertEqual(game.board.filled_cells, 4)
+        self.assertGreater(search.nodes, 0)
+
+    def test_time_budget(self):
+        game = Game()
+        search = Search()
+        column, score, depth = search.search(
+            game.board, Colour.PLAYER_1, time_budget=0.05)
+        self.assertIn(column, game.board.legal_moves())
+        self.assertGreaterEqual(depth, 1)
+        self.assertEqual(game.board.filled_cells, 0)
+
+    def test_full_game(self):
+        game = Game(
+            board_class=BitBoard,
+            player1=AIPlayer(Player.PLAYER_1, Colour.PLAYER_1, max_depth=2),
+            player2=AIPlayer(Player.PLAYER_2, Colour.PLAYER_2, max_depth=3),
+        )
+        while not game.winner:
+            self.assertTrue(game.play(game.turn.choose_move(game)))
+        self.assertIsNotNone(game.winner)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(stream=sys.stderr)
+    logging.getLogger().setLevel(logging.DEBUG)
+    unittest.main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+
+"""
+Tests for the Connect Four benchmark suite.
+Author: Chris Lyon
+Contact: chris@cplyon.ca
+Date: 2026-10-17
+"""
+
+import logging
+import sys
+import unittest
+
+from bench.bench_c4 import BENCHMARKS
+from bench.bench_c4 import compare
+from bench.bench_c4 import run
+
+
+class BenchTest(unittest.TestCase):
+
+    def test_run(self):
+        results = run([(4, 5, 3)], min_time=0.001)
+        self.assertEqual(len(results), len(BENCHMARKS))
+        for result in results.values():
+            self.assertGreater(result["value"], 0)
+        self.assertIn("drop_piece[4x5/3]", results)
+
+    def test_compare(self):
+        baseline = {
+            "fast[6x7/4]": {"value": 100.0, "higher_is_better": True},
+            "small[6x7/4]": {"value": 100.0, "higher_is_better": False},
+            "gone[6x7/4]": {"value": 100.0, "higher_is_better": True},
+        }
+        current = {
+            "fast[6x7/4]": {"value": 80.0, "higher_is_better": True},
+            "small[6x7/4]": {"value": 105.0, "higher_is_better": False},
+            "new[6x7/4]": {"value": 1.0, "higher_is_better": True},
+        }
+        regressions = compare(baseline, current, 0.1)
+        self.assertEqual([r[0] for r in regressions], ["fast[6x7/4]"])
+        self.assertAlmostEqual(regressions[0][3], 0.25)
+        self.assertEqual(
+            [r[0] for r in compare(baseline, current, 0.01)],
+            ["fast[6x7/4]", "small[6x7/4]"])
+
+
+if __name__ == "__main__":
+    logging.basicConfig(stream=sys.stderr)
+    logging.getLogger().setLevel(logging.DEBUG)
+    unittest.main()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+
+"""
+Tests for the bitboard Connect Four board.
+Author: Chris Lyon
+Contact: chris@cplyon.ca
+Date: 2026-10-17
+"""
+
+import logging
+import random
+import sys
+import unittest
+from c4.bitboard import BitBoard
+from c4.bitboard import has_streak
+from c4.c4 import Board
+from c4.c4 import Colour
+from c4.c4 import Game
+
+
+class BitBoardTest(unittest.TestCase):
+
+    ROWS = 6
+    COLUMNS = 7
+    GOAL = 4
+
+    def test_is_full_negative(self):
+        board = BitBoard(self.ROWS, self.COLUMNS, self.GOAL)
+        self.assertFalse(board.is_full())
+
+    def test_is_full_positive(self):
+        board = BitBoard(self.ROWS, self.COLUMNS, self.GOAL)
+        for c in range(board.columns):
+            for r in range(board.rows):
+                board.drop_piece(Colour.PLAYER_1, c)
+        self.assertEqual(board.filled_cells, board.rows * board.columns)
+        self.assertTrue(board.is_full())
+
+    def test_is_column_full(self):
+        board = BitBoard(self.ROWS, self.COLUMNS, self.GOAL)
+        self.assertFalse(board.is_column_full(0))
+        for r in range(board.rows):
+            board.drop_piece(Colour.PLAYER_1, 0)
+        self.assertTrue(board.is_column_full(0))
+
+    def test_drop_piece(self):
+        board = BitBoard(self.ROWS, self.COLUMNS, self.GOAL)
+        self.assertEqual(board.drop_piece(Colour.PLAYER_1, 0), board.rows - 1)
+        self.assertEqual(board[board.rows - 1][0], Colour.PLAYER_1)
+        self.assertEqual(board.drop_piece(Colour.PLAYER_2, 0), board.rows - 2)
+        self.assertEqual(board[board.rows - 2][0], Colour.PLAYER_2)
+        self.assertEqual(board[0][0], Colour.NONE)
+
+    def test_drop_piece_full_column(self):
+        board = BitBoard(self.ROWS, self.COLUMNS, self.GOAL)
+        for r in range(board.rows):
+            self.assertIsNotNone(board.drop_piece(Colour.PLAYER_1, 0))
+        self.assertIsNone(board.drop_piece(Colour.PLAYER_1, 0))
+
+    def test_undo(self):
+        board = BitBoard(self.ROWS, self.COLUMNS, self.GOAL)
+        self.assertIsNone(board.undo(0))
+        for r in range(board.rows):
+            board.drop_piece(Colour.PLAYER_2, 0)
+        self.assertEqual(board.undo(0), 0)
+        self.assertEqual(board[0][0], Colour.NONE)
+        self.assertEqual(board[1][0], Colour.PLAYER_2)
+        self.assertEqual(board.filled_cells, board.rows - 1)
+        self.assertEqual(board.legal_moves(), tuple(range(board.columns)))
+
+    def test_key_matches_board(self):
+        board = Board(self.ROWS, self.COLUMNS, self.GOAL)
+        bitboard = BitBoard(self.ROWS, self.COLUMNS, self.GOAL)
+        for c, colour in [(0, Colour.PLAYER_1), (3, Colour.PLAYER_2),
+                          (3, Colour.PLAYER_1)]:
+            board.drop_piece(colour, c)
+            bitboard.drop_piece(colour, c)
+        self.assertEqual(board.key, bitboard.key)
+        self.assertEqual(board.canonical_key(), bitboard.canonical_key())
+        board.undo(3)
+        bitboard.undo(3)
+        self.assertEqual(board.key, bitboard.key)
+        self.assertEqual(board.mirror_key, bitboard.mirror_key)
+
+    def test_str_matches_board(self):
+        board = Board(self.ROWS, self.COLUMNS, self.GOAL)
+        bitboard = BitBoard(self.ROWS, self.COLUMNS, self.GOAL)
+        for c, colour in [(0, Colour.PLAYER_1), (3, Colour.PLAYER_2),
+                          (3, Colour.PLAYER_1)]:
+            board.drop_piece(colour, c)
+            bitboard.drop_piece(colour, c)
+        self.assertEqual(str(board), str(bitboard))
+
+    def test_has_streak(self):
+        self.assertTrue(has_streak(0b1111, 1, 4))
+        self.assertFalse(has_streak(0b1110111, 1, 4))
+        self.assertTrue(has_streak(0b1111111, 1, 7))
+        self.assertTrue(has_streak(0b1001001, 3, 3))
+        self.assertFalse(has_streak(0b1001001, 3, 4))
+
+    def test_no_wrap_between_columns(self):
+        # three on top of column 0 and one at the bottom of column 1 are
+        # adjacent bits only if the guard bit is missing
+        board = BitBoard(self.ROWS, self.COLUMNS, self.GOAL)
+        for r in range(3):
+            board.drop_piece(Colour.PLAYER_2, 0)
+        for r in range(3):
+            board.drop_piece(Colour.PLAYER_1, 0)
+        board.drop_piece(Colour.PLAYER_1, 1)
+        self.assertFalse(board.check_vertical(Colour.PLAYER_1, 0, 0))
+        self.assertFalse(board.check_top_left_to_bottom_right(
+            Colour.PLAYER_1, 0, 0))
+        self.assertFalse(board.check_top_right_to_bottom_left(
+            Colour.PLAYER_1, 0, 0))
+
+    def test_wins_match_board(self):
+        # play the same random games on both boards, with a few goals, and
+        # make sure every win check agrees
+        rng = random.Random(1234)
+        for goal in (3, 4, 5):
+            for _ in range(50):
+                board = Board(self.ROWS, self.COLUMNS, goal)
+                bitboard = BitBoard(self.ROWS, self.COLUMNS, goal)
+                colour = Colour.PLAYER_1
+                while not board.is_full():
+                    column = rng.choice([c for c in range(board.columns)
+                                         if not board.is_column_full(c)])
+                    row = board.drop_piece(colour, column)
+                    self.assertEqual(bitboard.drop_piece(colour, column), row)
+                    self.assertEqual(
+                        board.check_horizontal(colour, row, column),
+                        bitboard.check_horizontal(colour, row, column))
+                    self.assertEqual(
+                        board.check_horizontal(colour, row),
+                        bitboard.check_horizontal(colour, row))
+                    self.assertEqual(
+                        board.check_vertical(colour, row, column),
+                        bitboard.check_vertical(colour, row, column))
+                    self.assertEqual(
+                        board.check_top_left_to_bottom_right(
+                            colour, row, column),
+                        bitboard.check_top_left_to_bottom_right(
+                            colour, row, column))
+                    self.assertEqual(
+                        board.check_top_right_to_bottom_left(
+                            colour, row, column),
+                        bitboard.check_top_right_to_bottom_left(
+                            colour, row, column))
+                    if colour is Colour.PLAYER_1:
+                        colour = Colour.PLAYER_2
+                    else:
+                        colour = Colour.PLAYER_1
+
+    def test_game_with_bitboard(self):
+        game = Game(board_class=BitBoard)
+        self.assertIsInstance(game.board, BitBoard)
+        for r in range(4):
+            game.play(1)
+            game.play(2)
+        self.assertEqual(game.winner, game.player1.name)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(stream=sys.stderr)
+    logging.getLogger().setLevel(logging.DEBUG)
+    unittest.main()
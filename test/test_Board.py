@@ -47,12 +47,93 @@ class BoardTest(unittest.TestCase):
         self.assertEqual(board.drop_piece(Colour.PLAYER_1, 0), board.rows - 1)
         self.assertEqual(board[board.rows - 1][0], Colour.PLAYER_1)
 
+    def test_legal_moves(self):
+        board = Board(self.ROWS, self.COLUMNS, self.GOAL)
+        self.assertEqual(board.legal_moves(), tuple(range(board.columns)))
+        for r in range(board.rows):
+            board.drop_piece(Colour.PLAYER_1, 2)
+        self.assertNotIn(2, board.legal_moves())
+        self.assertEqual(len(board.legal_moves()), board.columns - 1)
+
+    def test_drop_piece_stacks(self):
+        board = Board(self.ROWS, self.COLUMNS, self.GOAL)
+        for r in reversed(range(board.rows)):
+            self.assertEqual(board.drop_piece(Colour.PLAYER_2, 3), r)
+            self.assertEqual(board[r][3], Colour.PLAYER_2)
+
     def test_drop_piece_full_column(self):
         board = Board(self.ROWS, self.COLUMNS, self.GOAL)
         for r in range(board.rows):
             self.assertIsNotNone(board.drop_piece(Colour.PLAYER_1, 0))
         self.assertIsNone(board.drop_piece(Colour.PLAYER_1, 0))
 
+    def test_undo(self):
+        board = Board(self.ROWS, self.COLUMNS, self.GOAL)
+        board.drop_piece(Colour.PLAYER_1, 0)
+        board.drop_piece(Colour.PLAYER_2, 0)
+        self.assertEqual(board.undo(0), board.rows - 2)
+        self.assertEqual(board[board.rows - 2][0], Colour.NONE)
+        self.assertEqual(board[board.rows - 1][0], Colour.PLAYER_1)
+        self.assertEqual(board.filled_cells, 1)
+        self.assertEqual(board.drop_piece(Colour.PLAYER_2, 0), board.rows - 2)
+
+    def test_undo_empty_column(self):
+        board = Board(self.ROWS, self.COLUMNS, self.GOAL)
+        self.assertIsNone(board.undo(0))
+        self.assertEqual(board.filled_cells, 0)
+
+    def test_undo_full_column(self):
+        board = Board(self.ROWS, self.COLUMNS, self.GOAL)
+        for r in range(board.rows):
+            board.drop_piece(Colour.PLAYER_1, 3)
+        self.assertNotIn(3, board.legal_moves())
+        self.assertEqual(board.undo(3), 0)
+        self.assertFalse(board.is_column_full(3))
+        self.assertEqual(board.legal_moves(), tuple(range(board.columns)))
+
+    def test_key_transposition(self):
+        board1 = Board(self.ROWS, self.COLUMNS, self.GOAL)
+        board2 = Board(self.ROWS, self.COLUMNS, self.GOAL)
+        self.assertEqual(board1.key, 0)
+        for colour, column in [(Colour.PLAYER_1, 0), (Colour.PLAYER_2, 3),
+                               (Colour.PLAYER_1, 5)]:
+            board1.drop_piece(colour, column)
+        for colour, column in [(Colour.PLAYER_1, 5), (Colour.PLAYER_2, 3),
+                               (Colour.PLAYER_1, 0)]:
+            board2.drop_piece(colour, column)
+        self.assertEqual(board1.key, board2.key)
+        self.assertNotEqual(board1.key, 0)
+
+    def test_key_undo(self):
+        board = Board(self.ROWS, self.COLUMNS, self.GOAL)
+        board.drop_piece(Colour.PLAYER_1, 2)
+        key = board.key
+        board.drop_piece(Colour.PLAYER_2, 2)
+        self.assertNotEqual(board.key, key)
+        board.undo(2)
+        self.assertEqual(board.key, key)
+        board.undo(2)
+        self.assertEqual(board.key, 0)
+        self.assertEqual(board.mirror_key, 0)
+
+    def test_key_colours_differ(self):
+        board1 = Board(self.ROWS, self.COLUMNS, self.GOAL)
+        board2 = Board(self.ROWS, self.COLUMNS, self.GOAL)
+        board1.drop_piece(Colour.PLAYER_1, 2)
+        board2.drop_piece(Colour.PLAYER_2, 2)
+        self.assertNotEqual(board1.key, board2.key)
+
+    def test_canonical_key_mirror(self):
+        board = Board(self.ROWS, self.COLUMNS, self.GOAL)
+        mirror = Board(self.ROWS, self.COLUMNS, self.GOAL)
+        for colour, column in [(Colour.PLAYER_1, 0), (Colour.PLAYER_2, 1),
+                               (Colour.PLAYER_1, 1)]:
+            board.drop_piece(colour, column)
+            mirror.drop_piece(colour, board.columns - 1 - column)
+        self.assertNotEqual(board.key, mirror.key)
+        self.assertEqual(board.key, mirror.mirror_key)
+        self.assertEqual(board.canonical_key(), mirror.canonical_key())
+
     def test_check_top_left_to_bottom_right_positive(self):
         board = Board(self.ROWS, self.COLUMNS, self.GOAL)
         for r in range(board.rows):
@@ -126,6 +207,30 @@ class BoardTest(unittest.TestCase):
         for r in range(board.rows):
             self.assertFalse(board.check_horizontal(Colour.PLAYER_1, r))
 
+    def test_check_horizontal_through_column(self):
+        board = Board(self.ROWS, self.COLUMNS, self.GOAL)
+        row = board.rows - 1
+        for c in range(1, 1 + board.goal):
+            board.drop_piece(Colour.PLAYER_1, c)
+        for c in range(1, 1 + board.goal):
+            self.assertTrue(board.check_horizontal(Colour.PLAYER_1, row, c))
+        # the streak is in the row, but does not pass through these cells
+        self.assertFalse(board.check_horizontal(Colour.PLAYER_1, row, 0))
+        board.drop_piece(Colour.PLAYER_2, 6)
+        self.assertFalse(board.check_horizontal(Colour.PLAYER_2, row, 6))
+        self.assertTrue(board.check_horizontal(Colour.PLAYER_1, row))
+
+    def test_check_large_board(self):
+        board = Board(50, 50, 8)
+        for c in range(20, 28):
+            board.drop_piece(Colour.PLAYER_1, c)
+        self.assertTrue(board.check_horizontal(Colour.PLAYER_1, 49, 23))
+        self.assertFalse(board.check_top_left_to_bottom_right(
+            Colour.PLAYER_1, 49, 23))
+        self.assertFalse(board.check_top_right_to_bottom_left(
+            Colour.PLAYER_1, 49, 23))
+        self.assertFalse(board.check_horizontal(Colour.PLAYER_1, 49, 28))
+
     def test_check_vertical_positive(self):
         board = Board(self.ROWS, self.COLUMNS, self.GOAL)
         for r in range(board.rows):
@@ -14,6 +14,7 @@ import unittest
 from c4.c4 import Game
 from c4.c4 import Colour
 from c4.c4 import Player
+from c4.c4 import PlayResult
 
 
 class GameTest(unittest.TestCase):
@@ -31,7 +32,7 @@ class GameTest(unittest.TestCase):
         game = Game()
         for r in range(game.board.rows):
             # fill up column
-            game.board[r][0] = Colour.PLAYER_1
+            game.board.drop_piece(Colour.PLAYER_1, 0)
         self.assertFalse(game.play(1))
 
     def test_play_empty_board(self):
@@ -69,6 +70,88 @@ class GameTest(unittest.TestCase):
             game.play(2)
         self.assertEqual(game.winner, game.player1.name)
 
+    def test_play_many(self):
+        game = Game()
+        result = game.play_many([3, 3, 2])
+        self.assertEqual(result, PlayResult(3, None, None))
+        self.assertEqual(game.moves, [3, 3, 2])
+        self.assertEqual(game.turn, game.player2)
+
+    def test_play_many_iterator(self):
+        game = Game()
+        result = game.play_many(iter(range(game.board.columns)))
+        self.assertEqual(result.applied, game.board.columns)
+        self.assertIsNone(result.stopped)
+
+    def test_play_many_stops_at_illegal(self):
+        for bad in (-1, Game.DEFAULT_COLUMNS):
+            game = Game()
+            result = game.play_many([0, 1, bad, 2])
+            self.assertEqual(result, PlayResult(2, None, 2))
+            self.assertEqual(game.moves, [0, 1])
+        game = Game()
+        result = game.play_many([0] * (game.board.rows + 1))
+        self.assertEqual(result.applied, game.board.rows)
+        self.assertEqual(result.stopped, game.board.rows)
+
+    def test_play_many_stops_at_win(self):
+        game = Game()
+        result = game.play_many([0, 1, 0, 1, 0, 1, 0, 1, 1])
+        self.assertEqual(result, PlayResult(7, game.player1.name, 6))
+        self.assertEqual(len(game.moves), 7)
+        # the game is over, so nothing more is played
+        self.assertEqual(game.play_many([3]), PlayResult(0, Player.PLAYER_1, 0))
+
+    def test_play_many_matches_play(self):
+        moves = [3, 2, 3, 4, 4, 1, 5, 5, 6, 0]
+        game = Game()
+        for column in moves:
+            game.play(column + 1)
+        replayed = Game()
+        replayed.play_many(moves)
+        self.assertEqual(str(game.board), str(replayed.board))
+        self.assertEqual(game.winner, replayed.winner)
+        self.assertEqual(game.turn, replayed.turn)
+
+    def test_undo_empty_board(self):
+        game = Game()
+        self.assertFalse(game.undo())
+
+    def test_undo_restores_turn(self):
+        game = Game()
+        game.play(3)
+        game.play(4)
+        self.assertEqual(game.moves, [2, 3])
+        self.assertTrue(game.undo())
+        self.assertEqual(game.moves, [2])
+        self.assertEqual(game.turn, game.player2)
+        self.assertEqual(game.board.filled_cells, 1)
+        self.assertEqual(game.board[game.board.rows - 1][3], Colour.NONE)
+
+    def test_undo_restores_winner(self):
+        game = Game()
+        for r in range(4):
+            game.play(1)
+            game.play(2)
+        # player 2's move after the win is taken back without clearing it
+        self.assertTrue(game.undo())
+        self.assertEqual(game.winner, game.player1.name)
+        self.assertTrue(game.undo())
+        self.assertIsNone(game.winner)
+        self.assertEqual(game.turn, game.player1)
+        self.assertTrue(game.play(1))
+        self.assertEqual(game.winner, game.player1.name)
+
+    def test_undo_all_moves(self):
+        game = Game()
+        for column in [4, 4, 3, 5, 2, 1]:
+            game.play(column)
+        while game.undo():
+            pass
+        self.assertEqual(game.board.filled_cells, 0)
+        self.assertEqual(game.turn, game.player1)
+        self.assertEqual(str(game.board), str(Game().board))
+
     def test_determine_winner_empty_board(self):
         game = Game()
         self.assertIsNone(game.determine_winner(Colour.PLAYER_1, 0, 0))
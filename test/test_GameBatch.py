@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+"""
+Tests for the NumPy Connect Four engine.
+Author: Chris Lyon
+Contact: chris@cplyon.ca
+Date: 2026-10-17
+"""
+
+import logging
+import sys
+import unittest
+
+from c4.c4 import Colour
+from c4.c4 import Game
+
+try:
+    import numpy as np
+    from c4.vector import GameBatch
+    from c4.vector import find_streaks
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class GameBatchTest(unittest.TestCase):
+
+    def test_find_streaks(self):
+        mask = np.zeros((5, 6, 7), dtype=bool)
+        mask[1, 5, 2:6] = True
+        mask[2, 1:5, 0] = True
+        for i in range(4):
+            mask[3, i + 1, i + 2] = True
+            mask[4, i + 2, 6 - i] = True
+        self.assertEqual(find_streaks(mask, 4).tolist(),
+                         [False, True, True, True, True])
+        self.assertEqual(find_streaks(mask, 5).tolist(), [False] * 5)
+
+    def test_step(self):
+        batch = GameBatch(2)
+        played = batch.step([0, 3])
+        self.assertEqual(played.tolist(), [True, True])
+        self.assertEqual(batch.cells[0, batch.rows - 1, 0], Colour.PLAYER_1)
+        self.assertEqual(batch.cells[1, batch.rows - 1, 3], Colour.PLAYER_1)
+        self.assertEqual(batch.turn.tolist(), [Colour.PLAYER_2] * 2)
+
+    def test_step_invalid(self):
+        batch = GameBatch(3)
+        for r in range(batch.rows):
+            batch.step([0, 1, 2])
+        played = batch.step([0, -1, batch.columns])
+        self.assertEqual(played.tolist(), [False, False, False])
+        self.assertEqual(batch.filled_cells.tolist(), [batch.rows] * 3)
+        self.assertEqual(batch.turn.tolist(), [Colour.PLAYER_1] * 3)
+
+    def test_vertical_win(self):
+        batch = GameBatch(1)
+        for r in range(4):
+            batch.step([0])
+            batch.step([1])
+        self.assertTrue(batch.done[0])
+        self.assertEqual(batch.winner[0], Colour.PLAYER_1)
+        self.assertEqual(batch.game_moves(0), [0, 1, 0, 1, 0, 1, 0])
+
+    def test_tie(self):
+        batch = GameBatch(1, rows=2, columns=2, goal=3)
+        batch.play_random(np.random.default_rng(0))
+        self.assertTrue(batch.done[0])
+        self.assertEqual(batch.winner[0], Colour.NONE)
+
+    def test_matches_game(self):
+        for rows, columns, goal in [(6, 7, 4), (5, 5, 3), (8, 9, 5)]:
+            batch = GameBatch(200, rows, columns, goal)
+            batch.play_random(np.random.default_rng(rows))
+            self.assertTrue(batch.done.all())
+            for board in range(batch.boards):
+                game = Game(rows=rows, columns=columns, goal=goal)
+                for column in batch.game_moves(board):
+                    self.assertIsNone(game.winner)
+                    self.assertTrue(game.play(column + 1))
+                if game.winner == Game.TIE:
+                    self.assertEqual(batch.winner[board], Colour.NONE)
+                elif game.winner == game.player1.name:
+                    self.assertEqual(batch.winner[board], Colour.PLAYER_1)
+                else:
+                    self.assertEqual(batch.winner[board], Colour.PLAYER_2)
+                for r in range(rows):
+                    self.assertEqual(list(game.board[r]),
+                                     batch.cells[board, r].tolist())
+
+
+if __name__ == "__main__":
+    logging.basicConfig(stream=sys.stderr)
+    logging.getLogger().setLevel(logging.DEBUG)
+    unittest.main()
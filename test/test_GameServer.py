@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+"""
+Tests for the Connect Four game server.
+Author: Chris Lyon
+Contact: chris@cplyon.ca
+Date: 2026-10-17
+"""
+
+import asyncio
+import logging
+import sys
+import unittest
+
+from c4.server import GameServer
+from c4.server import play_client
+
+
+class GameServerTest(unittest.IsolatedAsyncioTestCase):
+
+    async def start(self, **kwargs):
+        self.server = GameServer(**kwargs)
+        self.listener = await self.server.start("127.0.0.1", 0)
+        self.port = self.listener.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.listener.close()
+        await self.listener.wait_closed()
+
+    async def play(self, first: list, second: list) -> tuple:
+        task1 = asyncio.create_task(play_client("127.0.0.1", self.port, first))
+        # make sure the first client is seated as player 1
+        while self.server._waiting is None:
+            await asyncio.sleep(0.001)
+        task2 = asyncio.create_task(play_client("127.0.0.1", self.port, second))
+        return await asyncio.gather(task1, task2)
+
+    async def test_game(self):
+        await self.start(idle_timeout=5)
+        first, second = await self.play([1, 1, 1, 1], [2, 2, 2])
+        self.assertEqual(first[:3], ["WAITING", "START 1", "YOUR_TURN"])
+        self.assertEqual(second[0], "START 2")
+        self.assertEqual(first[-2:], ["MOVE 1 1", "WINNER 1"])
+        self.assertEqual(second[-2:], ["MOVE 1 1", "WINNER 1"])
+        self.assertEqual(self.server.games_played, 1)
+
+    async def test_invalid_move(self):
+        await self.start(idle_timeout=5)
+        first, second = await self.play(["x", 9, 1, 1, 1, 1], [2, 2, 2])
+        self.assertEqual(first.count("INVALID"), 2)
+        self.assertEqual(first[-1], "WINNER 1")
+
+    async def test_abandoned(self):
+        await self.start(idle_timeout=5)
+        first, second = await self.play([1], [])
+        self.assertEqual(first[-1], "ABANDONED")
+        self.assertEqual(self.server.games_played, 0)
+
+    async def test_waiting_timeout(self):
+        await self.start(idle_timeout=0.05)
+        transcript = await play_client("127.0.0.1", self.port, [])
+        self.assertEqual(transcript, ["WAITING", "TIMEOUT"])
+        self.assertIsNone(self.server._waiting)
+
+    async def test_move_timeout(self):
+        await self.start(idle_timeout=0.1)
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        self.assertEqual(await reader.readline(), b"WAITING\n")
+        task = asyncio.create_task(play_client("127.0.0.1", self.port, [1]))
+        transcript = await task
+        self.assertEqual(transcript[-1], "TIMEOUT")
+        writer.close()
+        await writer.wait_closed()
+
+    async def test_busy(self):
+        await self.start(idle_timeout=5, max_connections=1)
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        self.assertEqual(await reader.readline(), b"WAITING\n")
+        transcript = await play_client("127.0.0.1", self.port, [])
+        self.assertEqual(transcript, ["BUSY"])
+        writer.close()
+        await writer.wait_closed()
+
+    async def test_many_games(self):
+        await self.start(idle_timeout=5)
+        games = []
+        for _ in range(50):
+            games.append(await self.play_later([4, 4, 4, 4], [5, 5, 5]))
+        results = await asyncio.gather(*games)
+        for first, second in results:
+            self.assertEqual(first[-1], "WINNER 1")
+        self.assertEqual(self.server.games_played, 50)
+
+    async def play_later(self, first: list, second: list):
+        task1 = asyncio.create_task(play_client("127.0.0.1", self.port, first))
+        while self.server._waiting is None:
+            await asyncio.sleep(0.001)
+        task2 = asyncio.create_task(play_client("127.0.0.1", self.port, second))
+        while self.server._waiting is not None:
+            await asyncio.sleep(0.001)
+        return asyncio.gather(task1, task2)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(stream=sys.stderr)
+    logging.getLogger().setLevel(logging.DEBUG)
+    unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+"""
+Tests for the Connect Four opening book.
+Author: Chris Lyon
+Contact: chris@cplyon.ca
+Date: 2026-10-17
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import unittest
+
+from c4.ai import AIPlayer
+from c4.ai import Search
+from c4.book import OpeningBook
+from c4.book import generate_book
+from c4.c4 import Board
+from c4.c4 import Colour
+from c4.c4 import Game
+from c4.c4 import Player
+
+
+class OpeningBookTest(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".c4ob")
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_generate_small_board(self):
+        # 4x4 with goal 3 is small enough to solve every position
+        count = generate_book(self.path, 3, rows=4, columns=4, goal=3)
+        with OpeningBook(self.path) as book:
+            self.assertEqual(len(book), count)
+            board = Board(4, 4, 3)
+            column, score = book.lookup(board)
+            self.assertIn(column, board.legal_moves())
+            expected = Search().search(board, Colour.PLAYER_1)
+            self.assertEqual(score, expected[1])
+
+    def test_lookup_mirrored(self):
+        generate_book(self.path, 2, search_depth=2)
+        with OpeningBook(self.path) as book:
+            board = Board(Game.DEFAULT_ROWS, Game.DEFAULT_COLUMNS, Game.GOAL)
+            mirror = Board(Game.DEFAULT_ROWS, Game.DEFAULT_COLUMNS, Game.GOAL)
+            board.drop_piece(Colour.PLAYER_1, 0)
+            mirror.drop_piece(Colour.PLAYER_1, board.columns - 1)
+            column, score = book.lookup(board)
+            mirror_column, mirror_score = book.lookup(mirror)
+            self.assertEqual(column, board.columns - 1 - mirror_column)
+            self.assertEqual(score, mirror_score)
+
+    def test_lookup_missing(self):
+        generate_book(self.path, 1, search_depth=1)
+        with OpeningBook(self.path) as book:
+            board = Board(Game.DEFAULT_ROWS, Game.DEFAULT_COLUMNS, Game.GOAL)
+            for column in (0, 0, 0):
+                board.drop_piece(Colour.PLAYER_1, column)
+            self.assertIsNone(book.lookup(board))
+            self.assertIsNone(book.lookup(Board(5, 5, 4)))
+
+    def test_ai_player_uses_book(self):
+        generate_book(self.path, 1, search_depth=1)
+        with OpeningBook(self.path) as book:
+            game = Game()
+            ai = AIPlayer(Player.PLAYER_1, Colour.PLAYER_1, book=book)
+            column, score = book.lookup(game.board)
+            self.assertEqual(ai.choose_move(game), column + 1)
+            self.assertIsNone(ai._search)
+
+    def test_not_a_book(self):
+        with open(self.path, "wb") as f:
+            f.write(b"\0" * 64)
+        with self.assertRaises(ValueError):
+            OpeningBook(self.path)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(stream=sys.stderr)
+    logging.getLogger().setLevel(logging.DEBUG)
+    unittest.main()
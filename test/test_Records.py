@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+"""
+Tests for Connect Four game record files.
+Author: Chris Lyon
+Contact: chris@cplyon.ca
+Date: 2026-10-17
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import unittest
+
+from c4.c4 import Game
+from c4.records import INDEX_INTERVAL
+from c4.records import RecordReader
+from c4.records import RecordWriter
+from c4.records import bits_per_move
+from c4.records import decode_moves
+from c4.records import encode_moves
+from c4.simulate import play_game
+
+
+class RecordsTest(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".c4gr")
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_bits_per_move(self):
+        self.assertEqual(bits_per_move(7), 3)
+        self.assertEqual(bits_per_move(8), 3)
+        self.assertEqual(bits_per_move(9), 4)
+        self.assertEqual(bits_per_move(1), 1)
+
+    def test_encode_decode(self):
+        moves = [3, 3, 4, 0, 6, 6, 2]
+        data = encode_moves(moves, 3)
+        self.assertEqual(len(data), 3)
+        self.assertEqual(decode_moves(data, len(moves), 3), moves)
+        self.assertEqual(encode_moves([], 3), b"")
+
+    def test_round_trip(self):
+        games = [play_game(i, 0).moves for i in range(3 * INDEX_INTERVAL + 5)]
+        games.append([])
+        with RecordWriter(self.path) as writer:
+            for moves in games:
+                writer.write(moves)
+        with RecordReader(self.path) as reader:
+            self.assertEqual(len(reader), len(games))
+            self.assertEqual(list(reader), games)
+            for i in (0, 1, INDEX_INTERVAL - 1, INDEX_INTERVAL,
+                      2 * INDEX_INTERVAL + 7, len(games) - 1):
+                self.assertEqual(reader[i], games[i])
+            self.assertEqual(reader[-1], [])
+            with self.assertRaises(IndexError):
+                reader[len(games)]
+
+    def test_compact(self):
+        games = [play_game(i, 0).moves for i in range(100)]
+        with RecordWriter(self.path) as writer:
+            for moves in games:
+                writer.write(moves)
+        total_moves = sum(len(moves) for moves in games)
+        # 3 bits a move, plus a length byte and padding per game
+        self.assertLess(os.path.getsize(self.path), total_moves * 3 / 8 + 300)
+
+    def test_game(self):
+        played = Game(rows=5, columns=9, goal=3)
+        for column in [5, 5, 6, 6, 7]:
+            played.play(column)
+        with RecordWriter(self.path, 5, 9, 3) as writer:
+            writer.write_game(played)
+        with RecordReader(self.path) as reader:
+            self.assertEqual((reader.rows, reader.columns, reader.goal),
+                             (5, 9, 3))
+            game = reader.game(0)
+        self.assertEqual(game.moves, played.moves)
+        self.assertEqual(game.winner, played.winner)
+        self.assertEqual(str(game.board), str(played.board))
+
+    def test_not_a_record_file(self):
+        with open(self.path, "wb") as f:
+            f.write(b"\0" * 64)
+        with self.assertRaises(ValueError):
+            RecordReader(self.path)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(stream=sys.stderr)
+    logging.getLogger().setLevel(logging.DEBUG)
+    unittest.main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+"""
+Tests for batch Connect Four simulation.
+Author: Chris Lyon
+Contact: chris@cplyon.ca
+Date: 2026-10-17
+"""
+
+import logging
+import sys
+import unittest
+
+from c4.c4 import Colour
+from c4.c4 import Game
+from c4.simulate import play_game
+from c4.simulate import simulate
+
+
+class SimulateTest(unittest.TestCase):
+
+    def test_play_game_deterministic(self):
+        self.assertEqual(play_game(3, 42), play_game(3, 42))
+        self.assertNotEqual(play_game(3, 42).moves, play_game(4, 42).moves)
+
+    def test_play_game_replays(self):
+        for policy in ("random", "centre", "greedy"):
+            result = play_game(0, 7, policy=policy)
+            game = Game()
+            for column in result.moves:
+                self.assertIsNone(game.winner)
+                self.assertTrue(game.play(column + 1))
+            self.assertIsNotNone(game.winner)
+            self.assertEqual(result.length, len(result.moves))
+            if game.winner == Game.TIE:
+                self.assertEqual(result.winner, Colour.NONE)
+            elif game.winner == game.player1.name:
+                self.assertEqual(result.winner, Colour.PLAYER_1)
+            else:
+                self.assertEqual(result.winner, Colour.PLAYER_2)
+
+    def test_custom_board(self):
+        result = play_game(0, 1, rows=3, columns=3, goal=3)
+        self.assertLessEqual(result.length, 9)
+
+    def test_chunks_in_order(self):
+        chunks = list(simulate(25, seed=5, workers=1, chunk_size=10))
+        self.assertEqual([len(chunk) for chunk in chunks], [10, 10, 5])
+        indices = [result.index for chunk in chunks for result in chunk]
+        self.assertEqual(indices, list(range(25)))
+
+    def test_same_results_any_workers(self):
+        serial = [r for chunk in simulate(20, seed=9, workers=1, chunk_size=3)
+                  for r in chunk]
+        parallel = [r for chunk in simulate(20, seed=9, workers=2,
+                                            chunk_size=7)
+                    for r in chunk]
+        self.assertEqual(serial, parallel)
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            next(simulate(1, policy="nonsense"))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(stream=sys.stderr)
+    logging.getLogger().setLevel(logging.DEBUG)
+    unittest.main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+
+"""
+Tests for the perfect-play Connect Four solver.
+Author: Chris Lyon
+Contact: chris@cplyon.ca
+Date: 2026-10-17
+"""
+
+import logging
+import os
+import random
+import sys
+import tempfile
+import unittest
+
+from c4.ai import Search
+from c4.c4 import Board
+from c4.c4 import Colour
+from c4.c4 import Game
+from c4.solver import Solver
+from c4.solver import TranspositionTable
+from c4.solver import encode
+
+
+class SolverTest(unittest.TestCase):
+
+    def test_encode(self):
+        board = Board(6, 7, 4)
+        board.drop_piece(Colour.PLAYER_1, 0)
+        board.drop_piece(Colour.PLAYER_2, 0)
+        board.drop_piece(Colour.PLAYER_1, 1)
+        position, mask, moves = encode(board)
+        self.assertEqual(moves, 3)
+        self.assertEqual(mask, 0b11 | (1 << 7))
+        # player 2 is to move
+        self.assertEqual(position, 0b10)
+
+    def test_immediate_win(self):
+        game = Game()
+        game.play_many([0, 1, 0, 1, 0, 1])
+        solver = Solver()
+        solution = solver.solve(game)
+        self.assertEqual(solution.winner, Colour.PLAYER_1)
+        self.assertEqual(solution.moves, 1)
+        self.assertEqual(solver.best_move(game)[0], 0)
+
+    def test_matches_search(self):
+        # on small boards the full-depth search is exact too
+        rng = random.Random(3)
+        for rows, columns, goal in [(4, 4, 3), (4, 5, 4)]:
+            solver = Solver(rows, columns, goal)
+            for _ in range(15):
+                game = Game(rows=rows, columns=columns, goal=goal)
+                for _ in range(rng.randrange(rows * columns - 1)):
+                    if game.winner:
+                        break
+                    game.play_many([rng.choice(game.board.legal_moves())])
+                if game.winner:
+                    continue
+                solution = solver.solve(game)
+                _, score, _ = Search().search(game.board, game.turn.colour)
+                remaining = rows * columns - game.board.filled_cells
+                if score > 0:
+                    self.assertEqual(solution.winner, game.turn.colour)
+                    self.assertEqual(solution.moves, remaining - score + 1)
+                elif score < 0:
+                    self.assertNotIn(solution.winner,
+                                     (game.turn.colour, Colour.NONE))
+                    self.assertEqual(solution.moves, remaining + score + 1)
+                else:
+                    self.assertEqual(solution.winner, Colour.NONE)
+                    self.assertEqual(solution.score, 0)
+
+    def test_best_move(self):
+        solver = Solver(4, 4, 3)
+        board = Board(4, 4, 3)
+        column, score = solver.best_move(board)
+        self.assertEqual(score, solver.solve(board).score)
+        board.drop_piece(Colour.PLAYER_1, column)
+        self.assertEqual(-score, solver.solve(board).score)
+
+    def test_game_over(self):
+        game = Game()
+        game.play_many([0, 1, 0, 1, 0, 1, 0])
+        with self.assertRaises(ValueError):
+            Solver().solve(game)
+
+    def test_board_mismatch(self):
+        with self.assertRaises(ValueError):
+            Solver().solve(Board(4, 4, 3))
+        with self.assertRaises(ValueError):
+            Solver(8, 8, 4)
+
+    def test_table(self):
+        table = TranspositionTable(6, 7, 4, size=11)
+        self.assertEqual(table.get(5), 0)
+        table.put(5, 9)
+        self.assertEqual(table.get(5), 9)
+        table.put(16, 3)
+        self.assertEqual(table.get(5), 0)
+        self.assertEqual(table.get(16), 3)
+
+    def test_persistent_table(self):
+        handle, path = tempfile.mkstemp(suffix=".c4tt")
+        os.close(handle)
+        os.remove(path)
+        try:
+            board = Board(4, 5, 4)
+            with Solver(4, 5, 4, table_size=10007, path=path) as solver:
+                expected = solver.solve(board)
+                cold = solver.nodes
+            with Solver(4, 5, 4, table_size=10007, path=path) as solver:
+                self.assertEqual(solver.solve(board), expected)
+                self.assertLess(solver.nodes, cold)
+            with self.assertRaises(ValueError):
+                Solver(4, 5, 3, table_size=10007, path=path)
+        finally:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(stream=sys.stderr)
+    logging.getLogger().setLevel(logging.DEBUG)
+    unittest.main()